@@ -11,7 +11,7 @@ from pgw.core.config import load_config
 from pgw.utils.console import console
 from pgw.utils.text import BYTES_PER_GB, BYTES_PER_KB, BYTES_PER_MB
 
-_CACHE_CATEGORIES = ["audio", "compressed", "downloads", "transcriptions"]
+_CACHE_CATEGORIES = ["audio", "compressed", "downloads", "hashes", "transcriptions"]
 
 
 def _dir_size(path: Path) -> tuple[int, int]:
@@ -43,7 +43,9 @@ def _format_size(size_bytes: int) -> str:
 def clean(
     category: Annotated[
         list[str] | None,
-        typer.Argument(help="Categories to clear: audio, compressed, downloads, transcriptions."),
+        typer.Argument(
+            help="Categories to clear: audio, compressed, downloads, hashes, transcriptions."
+        ),
     ] = None,
     dry_run: Annotated[
         bool,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -10,9 +11,11 @@ import typer
 from pgw.cli.utils import build_config_overrides, expand_inputs, print_batch_summary
 from pgw.core.config import PGWConfig, load_config
 from pgw.downloader.resolver import is_url, resolve
-from pgw.utils.audio import extract_audio
+from pgw.utils.audio import extract_audio, extract_audio_batch
 from pgw.utils.console import console, error, saved, stage, warning
 
+_AUDIO_SUFFIXES = {".wav", ".mp3", ".flac", ".ogg", ".m4a"}
+
 
 def transcribe(
     inputs: Annotated[
@@ -124,6 +127,8 @@ def transcribe(
     results: list[tuple[str, str, str]] = []
     console.print(f"[bold]Batch transcribing {len(expanded)} inputs...[/bold]\n")
 
+    prepared = _prepare_batch_audio(expanded, start, duration)
+
     for i, input_path in enumerate(expanded, 1):
         console.rule(f"[bold][{i}/{len(expanded)}] {input_path}[/bold]")
         try:
@@ -137,6 +142,7 @@ def transcribe(
                 refine,
                 start,
                 duration,
+                audio_path=prepared.get(input_path),
             )
             results.append((input_path, "success", ""))
         except Exception as e:
@@ -148,6 +154,37 @@ def transcribe(
     print_batch_summary(results, total=len(expanded))
 
 
+def _prepare_batch_audio(
+    inputs: list[str], start: str | None, duration: str | None
+) -> dict[str, Path]:
+    """Extract audio for every local video input in parallel.
+
+    Each video extracts next to itself as ``<stem>.wav``. Videos whose WAV
+    would be shared with another video (``lecture.mp4`` + ``lecture.mkv``)
+    or would overwrite an input (``lecture.wav``) are left out, so two
+    ffmpegs never write one file; the per-input pass handles them in turn.
+
+    Returns a map of input → extracted WAV for the inputs that succeeded.
+    Failures are left out so the per-input pass retries and reports them.
+    """
+    local = [p for p in inputs if not is_url(p) and Path(p).is_file()]
+    claimed = Counter(Path(p).resolve() for p in local)
+    local_videos = [p for p in local if Path(p).suffix.lower() not in _AUDIO_SUFFIXES]
+    claimed.update(Path(p).with_suffix(".wav").resolve() for p in local_videos)
+    local_videos = [p for p in local_videos if claimed[Path(p).with_suffix(".wav").resolve()] == 1]
+    if len(local_videos) < 2:
+        return {}
+
+    stage("Extracting audio", f"{len(local_videos)} files in parallel")
+    jobs = [(Path(p), Path(p).with_suffix(".wav")) for p in local_videos]
+    results = extract_audio_batch(jobs, start=start, duration=duration, return_exceptions=True)
+    return {
+        p: result[0]
+        for p, result in zip(local_videos, results)
+        if not isinstance(result, BaseException)
+    }
+
+
 def _transcribe_single(
     input_path: str,
     config: PGWConfig,
@@ -158,8 +195,12 @@ def _transcribe_single(
     refine: bool,
     start: str | None,
     duration: str | None,
+    audio_path: Path | None = None,
 ) -> None:
-    """Transcribe a single input file or URL."""
+    """Transcribe a single input file or URL.
+
+    *audio_path* skips extraction when the caller already produced the WAV.
+    """
     # Resolve input: URL → download, local path → use directly
     source = None
     if is_url(input_path):
@@ -176,13 +217,13 @@ def _transcribe_single(
         if not video_path.is_file():
             raise FileNotFoundError(f"File not found: {input_path}")
 
-    # Extract audio if input is a video file
-    audio_suffixes = {".wav", ".mp3", ".flac", ".ogg", ".m4a"}
-    if video_path.suffix.lower() in audio_suffixes:
-        audio_path = video_path
-    else:
-        stage("Extracting audio")
-        audio_path = extract_audio(video_path, start=start, duration=duration)
+    # Extract audio if input is a video file (unless batch mode already did)
+    if audio_path is None:
+        if video_path.suffix.lower() in _AUDIO_SUFFIXES:
+            audio_path = video_path
+        else:
+            stage("Extracting audio")
+            audio_path = extract_audio(video_path, start=start, duration=duration)
 
     # Determine output path
     if output is not None:
@@ -18,8 +18,10 @@ every nested field.
 from __future__ import annotations
 
 import tomllib
+from functools import lru_cache
 from importlib.resources import files
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any
 
 from pydantic import BaseModel
@@ -87,18 +89,47 @@ class PlayerConfig(BaseModel):
 
 
 def _load_toml(path: Path) -> dict[str, Any]:
-    """Load a TOML file if it exists, return empty dict otherwise."""
-    if path.is_file():
-        with open(path, "rb") as f:
-            return tomllib.load(f)
-    return {}
+    """Load a TOML file if it exists, return empty dict otherwise.
+
+    Parses are memoized on (path, mtime, size), so repeated
+    ``load_config()`` calls only re-read a file after it changes.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    if not S_ISREG(st.st_mode):
+        return {}
+    return _copy_tables(_parse_toml(str(path.resolve()), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=16)
+def _parse_toml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    with open(path, "rb") as f:
+        return tomllib.load(f)
 
 
 def _load_packaged_default() -> dict[str, Any]:
     """Load the packaged default.toml shipped with the wheel."""
+    return _copy_tables(_parse_packaged_default())
+
+
+@lru_cache(maxsize=1)
+def _parse_packaged_default() -> dict[str, Any]:
     return tomllib.loads((files("pgw.config") / "default.toml").read_text())
 
 
+def _copy_tables(data: dict[str, Any]) -> dict[str, Any]:
+    """Copy the tables of a parsed TOML tree, sharing everything else.
+
+    Only the dicts need fresh copies, since they are what a settings merge
+    could write into. Scalars are immutable, and arrays are replaced
+    wholesale by the merge and copied by model validation, so sharing them
+    with the memoized parse is safe.
+    """
+    return {k: _copy_tables(v) if type(v) is dict else v for k, v in data.items()}
+
+
 def _flatten_general(data: dict[str, Any]) -> dict[str, Any]:
     """Promote keys from a [general] section to top-level."""
     if "general" in data:
@@ -168,7 +199,12 @@ class PGWConfig(BaseSettings):
 
 
 def _expand_dot_paths(overrides: dict[str, object]) -> dict[str, Any]:
-    """Convert {'llm.backend': 'api'} → {'llm': {'backend': 'api'}}, dropping None."""
+    """Convert {'llm.backend': 'api'} → {'llm': {'backend': 'api'}}, dropping None.
+
+    Each key walks only its own dotted spine, creating or reusing one dict
+    per level. The TOML layers are never traversed here — pydantic-settings
+    merges the result over them field by field.
+    """
     nested: dict[str, Any] = {}
     for key, value in overrides.items():
         if value is None:
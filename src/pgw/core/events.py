@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from typing import Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineEvent:
     """A progress event emitted during pipeline execution.
 
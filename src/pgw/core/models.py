@@ -6,9 +6,13 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleSegment:
-    """A subtitle segment with text and timing, used for LLM processing."""
+    """A subtitle segment with text and timing, used for LLM processing.
+
+    Slotted: transcripts hold thousands of these, and no caller sets
+    ad-hoc attributes on them.
+    """
 
     text: str
     start: float  # seconds
@@ -16,7 +20,7 @@ class SubtitleSegment:
     speaker: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """Output from the translation engine."""
 
@@ -26,7 +30,7 @@ class TranslationResult:
     target_language: str
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoSource:
     """Resolved video source — either local file or downloaded."""
 
@@ -15,6 +15,7 @@ from pgw.utils.audio import extract_audio_cached
 from pgw.utils.cache import (
     atomic_write_text,
     cache_key,
+    content_identity,
     find_cached_file,
     get_cache_dir,
     link_or_copy,
@@ -77,6 +78,7 @@ def run_pipeline(
         output_dir=config.download_dir,
         fmt=config.download.format,
         language=sub_language,
+        hash_index_dir=get_cache_dir(config.workspace_dir, "hashes"),
     )
     emit("download", 1.0, "Input resolved")
 
@@ -86,20 +88,22 @@ def run_pipeline(
     workspace = create_workspace(title, base_dir=config.workspace_dir)
     paths = workspace_paths(workspace, language, target_lang=translate, video_ext=video_ext)
 
-    # Link video into workspace (symlink to save disk, copy as fallback).
+    # Link video into workspace (hard/symlink to save disk, copy as fallback).
     # Skip when stream URL is available — browser plays directly from CDN.
-    video_dest = paths["video"]
+    video_dest = paths.video
     if source.video_url:
         emit("download", 0.5, "Stream URL resolved — no video download")
         stage("Stream URL resolved", source.video_url[:60] + "…")
     elif not video_dest.is_file():
         if video_dest.is_symlink():
             video_dest.unlink()  # Remove broken symlink
-        link_or_copy(source.video_path, video_dest)
+        # Local inputs can live anywhere; keep an absolute link so the
+        # workspace stays valid if it is moved without the source.
+        link_or_copy(source.video_path, video_dest, relative=False)
 
     # Step 3: Extract audio (with cross-workspace cache)
     emit("audio", 0.0, "Extracting audio...")
-    audio_path = paths["audio"]
+    audio_path = paths.audio
     if not audio_path.is_file():
         clip_detail = ""
         if start or duration:
@@ -129,8 +133,8 @@ def run_pipeline(
     emit("audio", 1.0, "Audio ready")
 
     # Step 3.5: Use downloaded subtitles if available (skip Whisper)
-    vtt_path = paths["transcription_vtt"]
-    txt_path = paths["transcription_txt"]
+    vtt_path = paths.transcription_vtt
+    txt_path = paths.transcription_txt
     if source.subtitle_path and not vtt_path.is_file():
         from pgw.subtitles.converter import load_subtitles, save_subtitles
 
@@ -160,8 +164,8 @@ def run_pipeline(
     # so the same episode transcribed in multiple workspaces shares the cache.
     audio_identity = None
     if source.content_hash:
-        audio_identity = cache_key(
-            content_hash=source.content_hash,
+        audio_identity = content_identity(
+            source.content_hash,
             sample_rate=16000,
             start=start,
             duration=duration,
@@ -170,8 +174,8 @@ def run_pipeline(
         import hashlib
 
         url_hash = hashlib.sha256(source.source_url.encode()).hexdigest()[:16]
-        audio_identity = cache_key(
-            content_hash=url_hash,
+        audio_identity = content_identity(
+            url_hash,
             sample_rate=16000,
             start=start,
             duration=duration,
@@ -194,24 +198,27 @@ def run_pipeline(
         trans_write_key = cache_key(audio_path, **trans_params)
     trans_write_path = trans_cache_dir / f"{trans_write_key}.json"
 
-    # Validate cached transcription JSON (could be corrupted from interrupted write)
-    if trans_cache_path is not None:
-        try:
-            json.loads(trans_cache_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            debug("Cached transcription corrupted, regenerating...")
-            trans_cache_path = None
-
     emit("transcribe", 0.0, "Transcribing...")
     if not vtt_path.is_file():
+        # Validate cached transcription JSON (could be corrupted from interrupted write).
+        # The parsed data is kept so cache hits below don't parse the file again,
+        # and each branch drops it before the memory-heavy steps that follow.
+        trans_cache_data = None
+        if trans_cache_path is not None:
+            try:
+                trans_cache_data = json.loads(trans_cache_path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                debug("Cached transcription corrupted, regenerating...")
+                trans_cache_path = None
+
         if use_api and trans_cache_path is not None:
             # Cache hit: load API segments from shared cache
             stage("Transcribing", config.whisper.model)
             cache_hit()
             from pgw.core.models import SubtitleSegment
 
-            raw = json.loads(trans_cache_path.read_text(encoding="utf-8"))
-            segments = [SubtitleSegment(**s) for s in raw]
+            segments = [SubtitleSegment(**s) for s in trans_cache_data]
+            del trans_cache_data
 
         elif use_api:
             # API transcription — returns segments directly, no WhisperResult
@@ -238,10 +245,12 @@ def run_pipeline(
 
             from pgw.subtitles.converter import result_to_segments
 
-            result = stable_whisper.WhisperResult(str(trans_cache_path))
+            result = stable_whisper.WhisperResult(trans_cache_data)
             segments = result_to_segments(result)
-            del result
+            del result, trans_cache_data
         else:
+            # A cache hit is not reused on this path; don't hold it while transcribing
+            del trans_cache_data
             from pgw.transcriber.stable_ts import transcribe
 
             result = transcribe(audio_path, config.whisper)
@@ -330,7 +339,7 @@ def run_pipeline(
 
     # Step 5: Optional translation
     if translate:
-        trans_vtt = paths["translation_vtt"]
+        trans_vtt = paths.translation_vtt
         if not trans_vtt.is_file():
             if trans_result is None:
                 from pgw.llm.translator import translate_subtitles
@@ -357,12 +366,12 @@ def run_pipeline(
             save_subtitles(trans_result.translated, trans_vtt, fmt="vtt")
             saved.append(trans_vtt)
 
-            trans_txt = paths["translation_txt"]
+            trans_txt = paths.translation_txt
             save_subtitles(trans_result.translated, trans_txt, fmt="txt")
             saved.append(trans_txt)
 
             # Bilingual VTT: original at bottom, translation at top
-            bi_vtt = paths["bilingual_vtt"]
+            bi_vtt = paths.bilingual_vtt
             save_bilingual_vtt(segments, trans_result.translated, bi_vtt)
             saved.append(bi_vtt)
             emit("translate", 1.0, "Translation complete")
@@ -511,7 +520,7 @@ def run_pipeline(
             mpv_play(
                 video_dest,
                 primary_subs=vtt_path,
-                bilingual_subs=paths.get("bilingual_vtt"),
+                bilingual_subs=paths.bilingual_vtt,
                 config=config.player,
             )
         else:
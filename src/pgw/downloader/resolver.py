@@ -25,6 +25,7 @@ def resolve(
     output_dir: Path | None = None,
     fmt: str | None = None,
     language: str | None = None,
+    hash_index_dir: Path | None = None,
 ) -> VideoSource:
     """Resolve input to a VideoSource.
 
@@ -41,6 +42,8 @@ def resolve(
         output_dir: Directory for downloaded/cached files.
         fmt: yt-dlp format string override.
         language: Source language code for subtitle download.
+        hash_index_dir: Directory for the persistent content-hash index
+            (see :func:`~pgw.utils.cache.file_hash`). Local files only.
 
     Returns:
         VideoSource with local video path and (when resolved) stream URLs.
@@ -67,7 +70,7 @@ def resolve(
 
     if path.stat().st_size > _DEBUG_SIZE_THRESHOLD:
         debug("Indexing file...")
-    content_hash = file_hash(path)
+    content_hash = file_hash(path, index_dir=hash_index_dir)
 
     return VideoSource(
         video_path=path,
@@ -1,10 +1,14 @@
 """Prompt templates for subtitle refinement and translation."""
 
 import json
+import re
 
 # Prefix for segments where translation failed or was missing
 UNTRANSLATED_MARKER = "[?] "
 
+# A stripped "N. text" / "N) text" / "N: text" line; the group is the text
+_NUMBERED_LINE_RE = re.compile(r"\d+\s*[.):] \s*(.*)")
+
 
 # ── JSON schema builders ──
 
@@ -264,8 +268,7 @@ def format_history_context(
     ]
     return (
         "Previous translations for style reference (do NOT re-translate these):\n"
-        + json.dumps(pairs, ensure_ascii=False)
-        + "\n\n"
+        f"{json.dumps(pairs, ensure_ascii=False)}\n\n"
     )
 
 
@@ -289,16 +292,9 @@ def parse_numbered_response(response: str, expected_count: int) -> tuple[list[st
         Tuple of (parsed texts, exact_match) where exact_match is True
         if the parsed count matches expected_count exactly.
     """
-    lines = [line.strip() for line in response.strip().splitlines() if line.strip()]
-
-    parsed = []
-    for line in lines:
-        for sep in [". ", ") ", ": "]:
-            parts = line.split(sep, 1)
-            if len(parts) == 2 and parts[0].strip().isdigit():
-                parsed.append(parts[1].strip())
-                break
-
+    parsed = [
+        m.group(1) for line in response.splitlines() if (m := _NUMBERED_LINE_RE.match(line.strip()))
+    ]
     return _normalize_parsed(parsed, expected_count)
 
 
@@ -392,7 +392,9 @@ def _redownload_video_streaming(workspace: Path, send_event: typing.Callable[[st
         video_dest = workspace / f"video{video_ext}"
         if video_dest.is_symlink():
             video_dest.unlink()
-        link_or_copy(video_path, video_dest)
+        # Downloads can live anywhere under the download dir; keep an absolute
+        # link so the workspace stays valid if it is moved without them.
+        link_or_copy(video_path, video_dest, relative=False)
 
         from types import SimpleNamespace
 
@@ -12,8 +12,10 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
+from typing import TextIO
 
 import pysubs2
+from pysubs2.formats import get_format_identifier
 
 from pgw.core.models import SubtitleSegment
 
@@ -29,48 +31,54 @@ _VTT_CUE_RE = re.compile(r"<\d{2}:\d{2}[:\.][\d.]+>")
 
 def result_to_segments(result) -> list[SubtitleSegment]:
     """Convert a stable-ts WhisperResult to SubtitleSegments for LLM processing."""
-    segments = []
-    for seg in result.segments:
-        segments.append(
-            SubtitleSegment(
-                text=seg.text.strip(),
-                start=seg.start,
-                end=seg.end,
-            )
-        )
-    return segments
+    return [
+        SubtitleSegment(text=seg.text.strip(), start=seg.start, end=seg.end)
+        for seg in result.segments
+    ]
 
 
-def save_subtitles(segments: list[SubtitleSegment], path: Path, fmt: str = "vtt") -> Path:
-    """Save LLM-modified SubtitleSegments to a subtitle file.
+def save_subtitles(
+    segments: list[SubtitleSegment], path: Path | TextIO, fmt: str = "vtt"
+) -> Path | TextIO:
+    """Save LLM-modified SubtitleSegments to a subtitle file or text stream.
 
     Args:
         segments: List of subtitle segments.
-        path: Output file path.
-        fmt: Format — "srt", "vtt", "ass", or "txt".
+        path: Output file path, or an open text stream (e.g. ``io.StringIO``).
+        fmt: Format — "srt", "vtt", "ass", or "txt". For paths, subtitle
+            formats other than "txt" follow the file extension.
 
     Returns:
-        The path the file was written to.
+        The path (or stream) that was written to.
     """
+    if not isinstance(path, (str, Path)):
+        path.write(_render_subtitles(segments, fmt))
+        return path
+
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Render in memory and write once; SSAFile.save streams through
+    # per-line writes on an open file.
+    format_ = fmt if fmt == "txt" else get_format_identifier(path.suffix.lower())
+    path.write_text(_render_subtitles(segments, format_), encoding="utf-8")
+    return path
+
 
+def _render_subtitles(segments: list[SubtitleSegment], fmt: str) -> str:
+    """Render segments as the text of a subtitle file in *fmt*."""
     if fmt == "txt":
-        text = "\n".join(seg.text for seg in segments if seg.text.strip())
-        path.write_text(text, encoding="utf-8")
-    else:
-        subs = pysubs2.SSAFile()
-        for seg in segments:
-            subs.events.append(
-                pysubs2.SSAEvent(
-                    start=pysubs2.make_time(s=seg.start),
-                    end=pysubs2.make_time(s=seg.end),
-                    text=seg.text,
-                )
+        return "\n".join(seg.text for seg in segments if seg.text.strip())
+
+    subs = pysubs2.SSAFile()
+    for seg in segments:
+        subs.events.append(
+            pysubs2.SSAEvent(
+                start=pysubs2.make_time(s=seg.start),
+                end=pysubs2.make_time(s=seg.end),
+                text=seg.text,
             )
-        subs.save(str(path))
-
-    return path
+        )
+    return subs.to_string(fmt)
 
 
 def save_bilingual_vtt(
@@ -123,22 +131,38 @@ def _format_vtt_time(seconds: float) -> str:
     return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
-def load_subtitles(path: Path) -> list[SubtitleSegment]:
-    """Load a subtitle file into SubtitleSegments.
+def load_subtitles(path: Path | TextIO, fmt: str | None = None) -> list[SubtitleSegment]:
+    """Load a subtitle file or text stream into SubtitleSegments.
 
     Supports SRT, VTT, ASS, and plain TXT (one line per segment, no timestamps).
+    Files are detected from their extension; streams need an explicit *fmt*.
+
+    Raises:
+        ValueError: If *path* is a stream and *fmt* is not given.
     """
-    path = Path(path)
+    if not isinstance(path, (str, Path)):
+        if fmt is None:
+            raise ValueError("fmt is required when loading subtitles from a stream")
+        text = path.read()
+        if fmt == "txt":
+            return _txt_to_segments(text)
+        return _events_to_segments(pysubs2.SSAFile.from_string(text, format_=fmt))
 
+    path = Path(path)
     if path.suffix == ".txt":
-        text = path.read_text(encoding="utf-8")
-        return [
-            SubtitleSegment(text=line.strip(), start=0.0, end=0.0)
-            for line in text.splitlines()
-            if line.strip()
-        ]
-
-    subs = pysubs2.load(str(path))
+        return _txt_to_segments(path.read_text(encoding="utf-8"))
+    return _events_to_segments(pysubs2.load(str(path)))
+
+
+def _txt_to_segments(text: str) -> list[SubtitleSegment]:
+    return [
+        SubtitleSegment(text=line.strip(), start=0.0, end=0.0)
+        for line in text.splitlines()
+        if line.strip()
+    ]
+
+
+def _events_to_segments(subs: pysubs2.SSAFile) -> list[SubtitleSegment]:
     return [
         SubtitleSegment(
             text=_strip_vtt_cues(event.plaintext),
@@ -16,8 +16,7 @@ EPUB_SEGMENTS_PER_CHAPTER = 100
 
 def _format_timestamp(seconds: float) -> str:
     """Format seconds as MM:SS for display."""
-    m = int(seconds // SECONDS_PER_MINUTE)
-    s = int(seconds % SECONDS_PER_MINUTE)
+    m, s = divmod(int(seconds), SECONDS_PER_MINUTE)
     return f"{m:02d}:{s:02d}"
 
 
@@ -203,6 +202,7 @@ def build_parallel_html(
 
     source_label = _lang_label(source_lang)
     target_label = _lang_label(target_lang)
+    title = html.escape(title)
 
     table_rows = "\n".join(
         _build_table_row(orig, trans) for orig, trans in zip(original, translated, strict=True)
@@ -212,14 +212,14 @@ def build_parallel_html(
 <html lang="{source_lang}">
 <head>
 <meta charset="utf-8">
-<title>{html.escape(title)}</title>
+<title>{title}</title>
 <style>
 {css}
 </style>
 </head>
 <body>
 <div class="header">
-  <h1>{html.escape(title)}</h1>
+  <h1>{title}</h1>
   <div class="subtitle">{source_label} &rarr; {target_label}</div>
   <div class="meta">{len(original)} segments &middot; PolyglotWhisperer</div>
 </div>
@@ -673,7 +673,7 @@ def build_vocab_html(summary: dict, title: str = "", css: str = "") -> str:
 
     language = summary.get("language", "")
     lang_label = _lang_label(language)
-    title = title or f"Vocabulary \u2014 {lang_label}"
+    title = html.escape(title or f"Vocabulary \u2014 {lang_label}")
 
     total = summary.get("total_words", 0)
     unique = summary.get("unique_lemmas", 0)
@@ -739,14 +739,14 @@ def build_vocab_html(summary: dict, title: str = "", css: str = "") -> str:
 <html lang="{language}">
 <head>
 <meta charset="utf-8">
-<title>{html.escape(title)}</title>
+<title>{title}</title>
 <style>
 {css}
 </style>
 </head>
 <body>
 <div class="header">
-  <h1>{html.escape(title)}</h1>
+  <h1>{title}</h1>
   <div class="subtitle">{lang_label}</div>
   <div class="meta">{len(words)} rare words &middot; PolyglotWhisperer</div>
 </div>
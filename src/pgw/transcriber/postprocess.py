@@ -7,7 +7,7 @@ dangling function words at segment boundaries.
 
 from __future__ import annotations
 
-import copy
+from dataclasses import replace
 
 from pgw.core.models import SubtitleSegment
 from pgw.utils.console import warning
@@ -290,7 +290,16 @@ def fix_dangling_clitics(segments: list[SubtitleSegment], language: str) -> list
     if nlp is None:
         return segments
 
-    fixed = [copy.copy(seg) for seg in segments]
+    # Segments are only copied when their text changes (dataclasses.replace),
+    # so the common no-fix path allocates nothing per segment.
+    fixed = list(segments)
+
+    # Tag every segment that may reach Pattern 2 in one nlp.pipe batch.
+    # A segment whose text gains a prefix from its predecessor is re-tagged
+    # below, since the extra context can change the last token's POS.
+    originals = [seg.text.strip() for seg in fixed[:-1]]
+    candidates = [i for i, t in enumerate(originals) if t and t[-1] not in APOSTROPHES]
+    docs = dict(zip(candidates, nlp.pipe(originals[i] for i in candidates)))
 
     for i in range(len(fixed) - 1):
         text = fixed[i].text.strip()
@@ -303,16 +312,18 @@ def fix_dangling_clitics(segments: list[SubtitleSegment], language: str) -> list
             space_idx = text.rfind(" ")
             if space_idx >= 0:
                 dangling = text[space_idx + 1 :]
-                fixed[i].text = text[:space_idx].rstrip()
-                fixed[i + 1].text = dangling + fixed[i + 1].text.lstrip()
+                fixed[i] = replace(fixed[i], text=text[:space_idx].rstrip())
+                fixed[i + 1] = replace(fixed[i + 1], text=dangling + fixed[i + 1].text.lstrip())
             else:
                 # Entire segment is a clitic (e.g. "l'")
-                fixed[i].text = ""
-                fixed[i + 1].text = text + fixed[i + 1].text.lstrip()
+                fixed[i] = replace(fixed[i], text="")
+                fixed[i + 1] = replace(fixed[i + 1], text=text + fixed[i + 1].text.lstrip())
             continue
 
         # Pattern 2: trailing function word or relative pronoun via spaCy
-        doc = nlp(text)
+        doc = docs.get(i) if text == originals[i] else None
+        if doc is None:
+            doc = nlp(text)
         if not doc or len(doc) <= 1:
             continue
 
@@ -321,7 +332,8 @@ def fix_dangling_clitics(segments: list[SubtitleSegment], language: str) -> list
             continue
 
         # Move the dangling token text to the next segment
-        fixed[i].text = text[: last_token.idx].rstrip()
-        fixed[i + 1].text = last_token.text.strip() + " " + fixed[i + 1].text.lstrip()
+        moved = last_token.text.strip() + " " + fixed[i + 1].text.lstrip()
+        fixed[i] = replace(fixed[i], text=text[: last_token.idx].rstrip())
+        fixed[i + 1] = replace(fixed[i + 1], text=moved)
 
     return [seg for seg in fixed if seg.text.strip()]
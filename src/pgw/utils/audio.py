@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import shutil
 import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from pgw.utils.cache import cache_key, find_cached_file, get_cache_dir, link_or_copy
+from pgw.utils.cache import cache_key, get_cache_dir, link_cached_file, link_or_copy
 
 
 def _is_url(source: str | Path) -> bool:
@@ -27,6 +30,10 @@ def extract_audio(
     sample_rate: int = 16000,
     start: str | None = None,
     duration: str | None = None,
+    probesize: int | None = None,
+    analyzeduration: int | None = None,
+    threads: int | None = None,
+    accurate_seek: bool = True,
 ) -> Path:
     """Extract audio to 16 kHz mono PCM WAV.
 
@@ -40,6 +47,16 @@ def extract_audio(
         sample_rate: Audio sample rate in Hz. Whisper expects 16000.
         start: Start time for clipping (ffmpeg format).
         duration: Duration to extract (ffmpeg format).
+        probesize: ffmpeg ``-probesize`` in bytes. Small values (e.g. 32)
+            skip most of ffmpeg's stream analysis, which dominates wall
+            time on short clips; leave unset for streams and containers
+            whose audio parameters need probing.
+        analyzeduration: ffmpeg ``-analyzeduration`` in microseconds.
+        threads: Decoder threads per ffmpeg. Use 1 when many ffmpegs run
+            side by side to avoid oversubscribing cores.
+        accurate_seek: If False, *start* snaps to the preceding keyframe
+            instead of decoding up to the exact timestamp — up to a GOP
+            less decoding per call, at the cost of a slightly early start.
 
     Returns:
         Path to the extracted audio file.
@@ -49,17 +66,9 @@ def extract_audio(
             file path does not exist.
         subprocess.CalledProcessError: If ffmpeg fails.
     """
-    if not check_ffmpeg():
-        raise FileNotFoundError("ffmpeg not found. Install it with: brew install ffmpeg")
-
-    source_str = str(video_path)
+    source_str = _check_source(video_path)
     is_remote = _is_url(source_str)
 
-    if not is_remote:
-        local = Path(video_path)
-        if not local.is_file():
-            raise FileNotFoundError(f"Video file not found: {local}")
-
     if output_path is None:
         if is_remote:
             output_path = Path("audio.wav")
@@ -69,16 +78,144 @@ def extract_audio(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    cmd = _ffmpeg_audio_cmd(
+        source_str,
+        sample_rate,
+        start,
+        duration,
+        probesize,
+        analyzeduration,
+        threads,
+        accurate_seek,
+    )
+    cmd.extend(["-y", str(output_path)])  # overwrite
+
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        stderr_msg = result.stderr.decode(errors="replace").strip()
+        raise subprocess.CalledProcessError(result.returncode, cmd, stderr=stderr_msg)
+    return output_path
+
+
+def extract_audio_stream(
+    video_path: Path | str,
+    sample_rate: int = 16000,
+    start: str | None = None,
+    duration: str | None = None,
+    probesize: int | None = None,
+    analyzeduration: int | None = None,
+    threads: int | None = None,
+    accurate_seek: bool = True,
+    chunk_size: int = 1 << 16,
+) -> Iterator[bytes]:
+    """Stream 16 kHz mono PCM WAV bytes from ffmpeg's stdout.
+
+    Same conversion as :func:`extract_audio`, but nothing touches the
+    disk — useful when the consumer (an upload, an in-memory decoder)
+    takes bytes anyway. ffmpeg cannot seek back on a pipe, so the RIFF
+    size fields in the header are placeholders; readers that trust them
+    should use :func:`extract_audio` instead.
+
+    Args:
+        video_path: Local file path or network URL.
+        sample_rate: Audio sample rate in Hz. Whisper expects 16000.
+        start: Start time for clipping (ffmpeg format).
+        duration: Duration to extract (ffmpeg format).
+        probesize, analyzeduration, threads, accurate_seek: See
+            :func:`extract_audio`.
+        chunk_size: Bytes per yielded chunk.
+
+    Yields:
+        Consecutive chunks of the WAV stream.
+
+    Raises:
+        FileNotFoundError: If ffmpeg is not installed, or if a local
+            file path does not exist (raised on call, not on iteration).
+        subprocess.CalledProcessError: If ffmpeg fails (raised once the
+            stream has been drained).
+    """
+    source_str = _check_source(video_path)
+    cmd = _ffmpeg_audio_cmd(
+        source_str,
+        sample_rate,
+        start,
+        duration,
+        probesize,
+        analyzeduration,
+        threads,
+        accurate_seek,
+    )
+    # Keep stderr small so it cannot fill its pipe while we drain stdout.
+    cmd[1:1] = ["-loglevel", "error"]
+    cmd.extend(["-f", "wav", "pipe:1"])
+
+    return _drain_ffmpeg(cmd, chunk_size)
+
+
+def _drain_ffmpeg(cmd: list[str], chunk_size: int) -> Iterator[bytes]:
+    """Run *cmd* and yield its stdout in *chunk_size* pieces."""
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20)
+    try:
+        yield from iter(lambda: proc.stdout.read(chunk_size), b"")
+        stderr = proc.stderr.read()
+        returncode = proc.wait()
+    finally:
+        # Consumer stopped early (or raised): don't leave ffmpeg running.
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+    if returncode != 0:
+        stderr_msg = stderr.decode(errors="replace").strip()
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_msg)
+
+
+def _check_source(video_path: Path | str) -> str:
+    """Validate that ffmpeg and a local *video_path* exist; return it as str."""
+    if not check_ffmpeg():
+        raise FileNotFoundError("ffmpeg not found. Install it with: brew install ffmpeg")
+
+    source_str = str(video_path)
+    if not _is_url(source_str):
+        local = Path(video_path)
+        if not local.is_file():
+            raise FileNotFoundError(f"Video file not found: {local}")
+    return source_str
+
+
+def _ffmpeg_audio_cmd(
+    source_str: str,
+    sample_rate: int,
+    start: str | None,
+    duration: str | None,
+    probesize: int | None = None,
+    analyzeduration: int | None = None,
+    threads: int | None = None,
+    accurate_seek: bool = True,
+) -> list[str]:
+    """Build the ffmpeg argv up to (but excluding) the output target."""
     cmd = ["ffmpeg"]
 
+    # Input options — must precede -i to apply to the demuxer/decoder
+    if probesize is not None:
+        cmd.extend(["-probesize", str(probesize)])
+    if analyzeduration is not None:
+        cmd.extend(["-analyzeduration", str(analyzeduration)])
+    if threads is not None:
+        cmd.extend(["-threads", str(threads)])
+
+    # -ss/-t as input options: the demuxer seeks straight to *start* and
+    # stops reading after *duration* instead of decoding and discarding.
     if start is not None:
+        if not accurate_seek:
+            cmd.append("-noaccurate_seek")
         cmd.extend(["-ss", str(start)])
-
-    cmd.extend(["-i", source_str])
-
     if duration is not None:
         cmd.extend(["-t", str(duration)])
 
+    cmd.extend(["-i", source_str])
+
     cmd.extend(
         [
             "-vn",  # no video
@@ -90,16 +227,67 @@ def extract_audio(
             "1",  # mono
             "-map_metadata",
             "-1",  # strip source metadata
-            "-y",  # overwrite
-            str(output_path),
         ]
     )
+    return cmd
+
+
+def extract_audio_clips(
+    video_path: Path | str,
+    clips: list[tuple[float, float, Path]],
+    sample_rate: int = 16000,
+) -> list[Path]:
+    """Extract several clips from one input with a single ffmpeg process.
+
+    Each clip is ``(start_seconds, duration_seconds, output_path)``. The
+    input is opened and demuxed once, seeking straight to the earliest
+    clip; every output then trims its own window from the shared decode.
+    Cheaper than one :func:`extract_audio` call per clip when the clips
+    are close together, since ffmpeg startup and probing happen once.
+
+    Returns:
+        Output paths, in the order given.
+
+    Raises:
+        FileNotFoundError: If ffmpeg is not installed, or if a local
+            file path does not exist.
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
+    if not clips:
+        return []
+
+    source_str = _check_source(video_path)
+    base = min(start for start, _, _ in clips)
+
+    cmd = ["ffmpeg", "-y", "-ss", f"{base:.3f}", "-i", source_str]
+    for start, duration, output_path in clips:
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        cmd.extend(
+            [
+                "-ss",
+                f"{start - base:.3f}",  # relative to the input seek point
+                "-t",
+                f"{duration:.3f}",
+                "-map",
+                "0:a:0",
+                "-acodec",
+                "pcm_s16le",
+                "-ar",
+                str(sample_rate),
+                "-ac",
+                "1",
+                "-map_metadata",
+                "-1",
+                str(output_path),
+            ]
+        )
 
     result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     if result.returncode != 0:
         stderr_msg = result.stderr.decode(errors="replace").strip()
         raise subprocess.CalledProcessError(result.returncode, cmd, stderr=stderr_msg)
-    return output_path
+    return [Path(out) for _, _, out in clips]
 
 
 def _hash_url(url: str) -> str:
@@ -114,14 +302,17 @@ def extract_audio_cached(
     sample_rate: int = 16000,
     start: str | None = None,
     duration: str | None = None,
+    probesize: int | None = None,
+    analyzeduration: int | None = None,
+    threads: int | None = None,
     content_hash: str | None = None,
     source_url: str | None = None,
 ) -> tuple[Path, bool]:
     """Extract audio with caching. Returns (path, cache_hit).
 
-    Cache lives at ``<workspace_dir>/.cache/audio/``. On hit, symlinks
+    Cache lives at ``<workspace_dir>/.cache/audio/``. On hit, links
     the cached file into the workspace. On miss, extracts to cache then
-    symlinks.
+    links.
 
     For local files: uses *content_hash* (SHA-256 of video content) for
     content-addressable caching, falling back to metadata-based keys.
@@ -137,6 +328,7 @@ def extract_audio_cached(
         sample_rate: Audio sample rate in Hz.
         start: Start time for clipping (ffmpeg format).
         duration: Duration to extract (ffmpeg format).
+        probesize, analyzeduration, threads: See :func:`extract_audio`.
         content_hash: SHA-256 of video content (local files).
         source_url: Source URL for stream-based caching.
 
@@ -160,16 +352,10 @@ def extract_audio_cached(
         resolved_file_path = video_path if not is_remote else None
 
     # Lookup
-    if cache_identity:
-        cached_path = find_cached_file(
-            cache_dir,
-            ".wav",
-            content_hash=cache_identity,
-            **params,
-        )
-        if cached_path is not None:
-            link_or_copy(cached_path, output_path)
-            return output_path, True
+    if cache_identity and link_cached_file(
+        cache_dir, ".wav", output_path, content_hash=cache_identity, **params
+    ):
+        return output_path, True
 
     # Determine write key
     if cache_identity:
@@ -189,6 +375,91 @@ def extract_audio_cached(
         sample_rate=sample_rate,
         start=start,
         duration=duration,
+        probesize=probesize,
+        analyzeduration=analyzeduration,
+        threads=threads,
     )
     link_or_copy(new_cached_path, output_path)
     return output_path, False
+
+
+def extract_audio_batch(
+    jobs: list[tuple[Path | str, Path]],
+    workspace_dir: Path | None = None,
+    sample_rate: int = 16000,
+    start: str | None = None,
+    duration: str | None = None,
+    probesize: int | None = None,
+    analyzeduration: int | None = None,
+    threads: int | None = 1,
+    max_workers: int | None = None,
+    return_exceptions: bool = False,
+) -> list[tuple[Path, bool] | BaseException]:
+    """Extract audio for many inputs concurrently, one ffmpeg per input.
+
+    Each job is a ``(video_path, output_path)`` pair. With *workspace_dir*
+    every job goes through :func:`extract_audio_cached`; without it, jobs
+    call :func:`extract_audio` directly and always report a cache miss.
+
+    The work happens inside ffmpeg subprocesses, so a thread pool is
+    enough to keep every core busy — threads only wait on the children.
+
+    Args:
+        jobs: ``(video_path, output_path)`` pairs.
+        workspace_dir: Base workspace directory for the shared audio cache.
+        sample_rate: Audio sample rate in Hz.
+        start: Start time for clipping (ffmpeg format), applied to every job.
+        duration: Duration to extract (ffmpeg format), applied to every job.
+        probesize, analyzeduration: See :func:`extract_audio`.
+        threads: Decoder threads per ffmpeg. Defaults to 1 here since the
+            pool already runs one ffmpeg per core.
+        max_workers: Concurrent ffmpeg processes. Defaults to the CPU count.
+        return_exceptions: If True, a failed job yields its exception in
+            the result list instead of raising.
+
+    Returns:
+        ``(audio_path, cache_hit)`` per job, in input order.
+    """
+
+    def _one(job: tuple[Path | str, Path]) -> tuple[Path, bool]:
+        video_path, output_path = job
+        if workspace_dir is not None:
+            return extract_audio_cached(
+                video_path,
+                output_path=output_path,
+                workspace_dir=workspace_dir,
+                sample_rate=sample_rate,
+                start=start,
+                duration=duration,
+                probesize=probesize,
+                analyzeduration=analyzeduration,
+                threads=threads,
+            )
+        path = extract_audio(
+            video_path,
+            output_path=output_path,
+            sample_rate=sample_rate,
+            start=start,
+            duration=duration,
+            probesize=probesize,
+            analyzeduration=analyzeduration,
+            threads=threads,
+        )
+        return path, False
+
+    if not jobs:
+        return []
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pgw-ffmpeg") as pool:
+        futures = [pool.submit(_one, job) for job in jobs]
+        results: list[tuple[Path, bool] | BaseException] = []
+        for future in futures:
+            exc = future.exception()
+            if exc is None:
+                results.append(future.result())
+            elif return_exceptions:
+                results.append(exc)
+            else:
+                raise exc
+    return results
@@ -1,8 +1,8 @@
 """Shared media cache for PolyglotWhisperer.
 
 Content-addressable cache at <workspace_dir>/.cache/ for extracted or
-processed media files. Cache hits are symlinked into workspace directories
-to avoid redundant work across runs.
+processed media files. Cache hits are linked (hardlink, else symlink) into
+workspace directories to avoid redundant work across runs.
 
 When a content hash (SHA-256) is available, cache keys are derived from
 the file content — so re-downloading the same video produces the same
@@ -15,22 +15,79 @@ from __future__ import annotations
 import hashlib
 import os
 import shutil
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
 
 
-def file_hash(file_path: Path) -> str:
+def file_hash(file_path: Path, index_dir: Path | None = None) -> str:
     """Compute SHA-256 hash of file contents.
 
     Reads in 1 MB chunks to handle large files efficiently.
 
+    With *index_dir*, digests are remembered in a small SQLite index keyed
+    by (resolved path, size, mtime_ns), so re-running on an unchanged local
+    file skips re-reading it. Any change to size or mtime misses the index
+    and rehashes. Leave it unset where the hash is an integrity check.
+
     Returns:
         Full 64-char hex SHA-256 digest.
     """
+    if index_dir is not None:
+        stat = os.stat(file_path)
+        ident = (_resolve(os.path.abspath(file_path)), stat.st_size, stat.st_mtime_ns)
+        cached = _hash_index_get(index_dir, ident)
+        if cached is not None:
+            return cached
+
     h = hashlib.sha256()
     with open(file_path, "rb") as f:
         for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
-    return h.hexdigest()
+    digest = h.hexdigest()
+
+    if index_dir is not None:
+        _hash_index_put(index_dir, ident, digest)
+    return digest
+
+
+_HASH_INDEX_FILE = "file_hashes.sqlite"
+
+
+def _hash_index_connect(index_dir: Path) -> sqlite3.Connection:
+    index_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(index_dir / _HASH_INDEX_FILE, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS file_hashes ("
+        " path TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+        " sha256 TEXT NOT NULL, PRIMARY KEY (path, size, mtime_ns))"
+    )
+    return conn
+
+
+def _hash_index_get(index_dir: Path, ident: tuple[str, int, int]) -> str | None:
+    """Return the indexed digest for *ident*, or None (a broken index is a miss)."""
+    try:
+        with closing(_hash_index_connect(index_dir)) as conn:
+            row = conn.execute(
+                "SELECT sha256 FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                ident,
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _hash_index_put(index_dir: Path, ident: tuple[str, int, int], digest: str) -> None:
+    """Record *digest* for *ident*, dropping stale rows for the same path."""
+    try:
+        with closing(_hash_index_connect(index_dir)) as conn, conn:
+            conn.execute("DELETE FROM file_hashes WHERE path = ?", ident[:1])
+            conn.execute("INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)", (*ident, digest))
+    except sqlite3.Error:
+        pass  # The index is an optimization; hashing already succeeded
 
 
 def cache_key(
@@ -54,20 +111,55 @@ def cache_key(
     Returns:
         16-char hex string.
     """
+    return _digest(_key_base(file_path, content_hash, params))
+
+
+def content_identity(content_hash: str, **params: object) -> str:
+    """Derive an identity that is nested into other keys as their *content_hash*.
+
+    Kept on the pre-BLAKE2 SHA-256 format: the outer lookups only probe
+    the legacy digest of the outer key, so a nested identity that changed
+    format would orphan every entry written before the switch.
+
+    Returns:
+        16-char hex string.
+    """
+    return _legacy_digest(_key_base(None, content_hash, params))
+
+
+def _key_base(file_path: Path | None, content_hash: str | None, params: dict) -> str:
+    """Build the string that :func:`cache_key` hashes."""
     if content_hash:
         base = content_hash
     elif file_path is not None:
-        resolved = file_path.resolve()
-        stat = resolved.stat()
-        base = f"{resolved}|{stat.st_size}|{stat.st_mtime_ns}"
+        # stat first: raises for missing files, and size/mtime always
+        # reflect the current target even if the path resolution is memoized.
+        stat = os.stat(file_path)
+        base = f"{_resolve(os.path.abspath(file_path))}|{stat.st_size}|{stat.st_mtime_ns}"
     else:
         raise ValueError("Either file_path or content_hash must be provided")
 
     for k, v in sorted(params.items()):
         base += f"|{k}={v}"
+    return base
+
+
+def _digest(base: str) -> str:
+    """BLAKE2b with an 8-byte digest — 16 hex chars without truncation."""
+    return hashlib.blake2b(base.encode(), digest_size=8, usedforsecurity=False).hexdigest()
+
+
+def _legacy_digest(base: str) -> str:
+    """Pre-BLAKE2 key format, still looked up so older caches keep hitting."""
     return hashlib.sha256(base.encode()).hexdigest()[:16]
 
 
+@lru_cache(maxsize=1024)
+def _resolve(path: str) -> str:
+    """Memoized ``Path.resolve()`` — one lstat per path component, paid once."""
+    return str(Path(path).resolve())
+
+
 def find_cached_file(
     cache_dir: Path,
     suffix: str,
@@ -88,28 +180,60 @@ def find_cached_file(
     Returns:
         Path to cached file if found, None otherwise.
     """
-    if content_hash:
-        key = cache_key(content_hash=content_hash, **params)
-        cached = cache_dir / f"{key}{suffix}"
-        if cached.is_file():
-            return cached
-        if cached.is_symlink():
-            cached.unlink(missing_ok=True)  # Clean up broken symlink
 
-    if file_path is not None:
-        try:
-            meta_key = cache_key(file_path=file_path, **params)
-            cached = cache_dir / f"{meta_key}{suffix}"
+    def bases() -> Iterator[str]:
+        if content_hash:
+            yield _key_base(None, content_hash, params)
+        if file_path is not None:
+            try:
+                meta_base = _key_base(file_path, None, params)
+            except OSError:
+                return  # File may not exist for metadata stat
+            yield meta_base
+
+    for base in bases():
+        for key in (_digest(base), _legacy_digest(base)):
+            cached = cache_dir / f"{key}{suffix}"
             if cached.is_file():
                 return cached
             if cached.is_symlink():
                 cached.unlink(missing_ok=True)  # Clean up broken symlink
-        except OSError:
-            pass  # File may not exist for metadata stat
 
     return None
 
 
+def link_cached_file(
+    cache_dir: Path,
+    suffix: str,
+    dest: Path,
+    *,
+    content_hash: str,
+    **params: object,
+) -> bool:
+    """Link a content-keyed cache entry to *dest*; return False on a miss.
+
+    Attempts the hardlink straight away instead of checking for the entry
+    first, so a hit costs one ``link`` call. Existence is only checked
+    when the link is refused for another reason (cross-device, existing
+    *dest*, …), in which case :func:`link_or_copy` handles the fallback.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    base = _key_base(None, content_hash, params)
+    for key in (_digest(base), _legacy_digest(base)):
+        cached = cache_dir / f"{key}{suffix}"
+        try:
+            os.link(cached, dest)
+            return True
+        except FileNotFoundError:
+            if cached.is_symlink():
+                cached.unlink(missing_ok=True)  # Clean up broken symlink
+        except OSError:
+            if cached.is_file():
+                link_or_copy(cached, dest)
+                return True
+    return False
+
+
 def get_cache_dir(workspace_dir: Path, category: str) -> Path:
     """Get or create a cache subdirectory (e.g. "audio")."""
     cache_dir = Path(workspace_dir) / ".cache" / category
@@ -135,13 +259,48 @@ def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None
         raise
 
 
-def link_or_copy(source: Path, dest: Path) -> None:
-    """Symlink source to dest, with copy fallback.
+def link_or_copy(source: Path, dest: Path, relative: bool = True) -> None:
+    """Hardlink source to dest, falling back to a symlink, then a copy.
+
+    Hardlinks cost no extra disk and leave nothing for later opens to
+    dereference; they fail across filesystems (EXDEV) or where the
+    filesystem refuses them, hence the fallbacks. A hardlinked workspace
+    file survives its cache entry being cleaned, so the disk space is
+    only freed once both are gone.
+
+    Symlinks are relative by default, so a workspace tree moved together
+    with its cache keeps working. Pass ``relative=False`` for links that
+    must survive the workspace moving on its own (e.g. to another volume).
 
     Creates parent directories as needed.
     """
     dest.parent.mkdir(parents=True, exist_ok=True)
     try:
+        os.link(source, dest)
+        return
+    except OSError:
+        pass
+    try:
+        if relative and _symlink_relative(source, dest):
+            return
         os.symlink(source.resolve(), dest)
     except OSError:
         shutil.copy2(source, dest)
+
+
+def _symlink_relative(source: Path, dest: Path) -> bool:
+    """Create a relative symlink; return False if it can't be used.
+
+    ``relpath`` is lexical, so a symlinked directory between the two
+    paths can make ``..`` land elsewhere — the link is checked once and
+    removed if it dangles.
+    """
+    try:
+        target = os.path.relpath(source, dest.parent)
+    except ValueError:
+        return False  # Different drives on Windows
+    os.symlink(target, dest)
+    if dest.exists():
+        return True
+    dest.unlink()
+    return False
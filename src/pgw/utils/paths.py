@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
 import re
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # ── Project metadata ──
@@ -29,12 +31,15 @@ GLOB_TRANSLATION_VTT = f"{STEM_TRANSLATION}.*.vtt"
 GLOB_VOCABULARY_JSON = f"{STEM_VOCABULARY}.*.json"
 
 
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEP_RE = re.compile(r"[-\s_]+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a filesystem-safe slug."""
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text)
+    text = _SLUG_STRIP_RE.sub("", text.lower().strip())
+    # Whitespace/underscore → dash and dash-run collapse in one pass
+    text = _SLUG_SEP_RE.sub("-", text)
     return text[:80].strip("-")
 
 
@@ -46,50 +51,91 @@ def create_workspace(
 
     Structure: <base_dir>/<slug>/<YYYYMMDD_HHMMSS>/
     Groups multiple runs of the same source under one parent slug dir.
+    Runs started within the same second get the next free second rather
+    than sharing a directory, so the name keeps the timestamp format.
     """
-    slug = slugify(title) or "untitled"
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    workspace = base_dir / slug / timestamp
-    workspace.mkdir(parents=True, exist_ok=True)
-    return workspace
+    slug_dir = base_dir / (slugify(title) or "untitled")
+    started = datetime.now().replace(microsecond=0)
+    while True:
+        workspace = slug_dir / started.strftime("%Y%m%d_%H%M%S")
+        try:
+            workspace.mkdir(parents=True)
+        except FileExistsError:
+            started += timedelta(seconds=1)
+            continue
+        return workspace
 
 
 _VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".avi", ".mov", ".ts", ".flv")
+_VIDEO_NAMES = tuple(f"video{ext}" for ext in _VIDEO_EXTENSIONS)
 
 
 def find_video(workspace: Path) -> Path | None:
-    """Find the video file in a workspace by globbing known extensions.
+    """Find the video file in a workspace among known extensions.
 
-    Returns the first match, or None if no video is found.
+    Reads the directory once and returns the match for the earliest
+    extension in ``_VIDEO_EXTENSIONS``, or None if no video is found.
     """
-    for ext in _VIDEO_EXTENSIONS:
-        candidates = sorted(workspace.glob(f"video{ext}"))
-        for c in candidates:
-            if c.is_file():  # Skip broken symlinks
-                return c
+    try:
+        with os.scandir(workspace) as it:
+            found = {entry.name: entry for entry in it if entry.name in _VIDEO_NAMES}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    for name in _VIDEO_NAMES:
+        entry = found.get(name)
+        if entry is not None and entry.is_file():  # Skip broken symlinks
+            return Path(entry.path)
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class WorkspacePaths:
+    """Standard output paths for a workspace.
+
+    Translation paths are None when no target language was requested.
+    """
+
+    video: Path
+    audio: Path
+    transcription_vtt: Path
+    transcription_txt: Path
+    metadata: Path
+    translation_vtt: Path | None = None
+    translation_txt: Path | None = None
+    bilingual_vtt: Path | None = None
+
+    def as_dict(self) -> dict[str, Path]:
+        """Return the set paths keyed by field name, omitting unset ones."""
+        return {
+            name: value for name in self.__slots__ if (value := getattr(self, name)) is not None
+        }
+
+
 def workspace_paths(
     workspace: Path, language: str, target_lang: str | None = None, video_ext: str = ".mp4"
-) -> dict:
+) -> WorkspacePaths:
     """Generate standard output paths for a workspace.
 
-    Returns a dict with keys: video, audio, transcription_vtt, transcription_txt,
-    translation_vtt, translation_txt, bilingual_vtt, metadata.
+    Returns a :class:`WorkspacePaths`; use ``.as_dict()`` for the mapping
+    form with keys video, audio, transcription_vtt, transcription_txt,
+    metadata and, with *target_lang*, translation_vtt, translation_txt,
+    bilingual_vtt.
     """
-    paths = {
-        "video": workspace / f"video{video_ext}",
-        "audio": workspace / AUDIO_FILE,
-        "transcription_vtt": workspace / f"{STEM_TRANSCRIPTION}.{language}.vtt",
-        "transcription_txt": workspace / f"{STEM_TRANSCRIPTION}.{language}.txt",
-        "metadata": workspace / METADATA_FILE,
-    }
+    translation = {}
     if target_lang:
-        paths["translation_vtt"] = workspace / f"{STEM_TRANSLATION}.{target_lang}.vtt"
-        paths["translation_txt"] = workspace / f"{STEM_TRANSLATION}.{target_lang}.txt"
-        paths["bilingual_vtt"] = workspace / f"{STEM_BILINGUAL}.{language}-{target_lang}.vtt"
-    return paths
+        translation = {
+            "translation_vtt": workspace / f"{STEM_TRANSLATION}.{target_lang}.vtt",
+            "translation_txt": workspace / f"{STEM_TRANSLATION}.{target_lang}.txt",
+            "bilingual_vtt": workspace / f"{STEM_BILINGUAL}.{language}-{target_lang}.vtt",
+        }
+    return WorkspacePaths(
+        video=workspace / f"video{video_ext}",
+        audio=workspace / AUDIO_FILE,
+        transcription_vtt=workspace / f"{STEM_TRANSCRIPTION}.{language}.vtt",
+        transcription_txt=workspace / f"{STEM_TRANSCRIPTION}.{language}.txt",
+        metadata=workspace / METADATA_FILE,
+        **translation,
+    )
 
 
 def save_metadata(workspace: Path, **kwargs: object) -> Path:
@@ -101,14 +147,20 @@ def save_metadata(workspace: Path, **kwargs: object) -> Path:
     meta_path = workspace / METADATA_FILE
 
     # Build file inventory from workspace contents
-    files = {}
-    for f in sorted(workspace.iterdir()):
-        if f.name == METADATA_FILE or f.name.startswith("."):
-            continue
-        files[f.name] = {
-            "size_bytes": f.stat().st_size,
-            "type": _classify_file(f.name),
+    # Filter by name before stat'ing; sizes follow symlinks so a linked
+    # source video reports the real file size.
+    with os.scandir(workspace) as it:
+        entries = sorted(
+            (e for e in it if e.name != METADATA_FILE and not e.name.startswith(".")),
+            key=lambda e: e.name,
+        )
+    files = {
+        e.name: {
+            "size_bytes": e.stat().st_size,
+            "type": _classify_file(e.name),
         }
+        for e in entries
+    }
 
     data = {
         "created_at": datetime.now(timezone.utc).isoformat(),
@@ -120,20 +172,22 @@ def save_metadata(workspace: Path, **kwargs: object) -> Path:
     return meta_path
 
 
+# (name prefix, accepted suffixes, file type) — first match wins.
+# "" as a suffix accepts any name with that prefix.
+_FILE_TYPES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("video", ("",), "source_video"),
+    ("audio", ("",), "extracted_audio"),
+    (STEM_BILINGUAL, (".vtt",), "bilingual_subtitle"),
+    (STEM_TRANSCRIPTION, (".srt", ".vtt"), "transcription_subtitle"),
+    (STEM_TRANSCRIPTION, (".txt",), "transcription_text"),
+    (STEM_TRANSLATION, (".srt", ".vtt"), "translation_subtitle"),
+    (STEM_TRANSLATION, (".txt",), "translation_text"),
+)
+
+
 def _classify_file(name: str) -> str:
     """Classify a workspace file by its name."""
-    if name.startswith("video"):
-        return "source_video"
-    if name.startswith("audio"):
-        return "extracted_audio"
-    if name.startswith("bilingual") and name.endswith(".vtt"):
-        return "bilingual_subtitle"
-    if name.startswith("transcription") and name.endswith((".srt", ".vtt")):
-        return "transcription_subtitle"
-    if name.startswith("transcription") and name.endswith(".txt"):
-        return "transcription_text"
-    if name.startswith("translation") and name.endswith((".srt", ".vtt")):
-        return "translation_subtitle"
-    if name.startswith("translation") and name.endswith(".txt"):
-        return "translation_text"
+    for prefix, suffixes, file_type in _FILE_TYPES:
+        if name.startswith(prefix) and name.endswith(suffixes):
+            return file_type
     return "other"
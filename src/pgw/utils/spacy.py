@@ -1,16 +1,20 @@
 """Shared spaCy model loading with auto-download support.
 
 Provides a unified loader for spaCy models in two configurations:
-- POS-only (disable lemmatizer) — used by postprocess.py for segmentation
+- POS-only (exclude lemmatizer) — used by postprocess.py for segmentation
 - POS + lemmatizer — used by vocab summary for word analysis
 
-Models are cached per (language, configuration) to avoid redundant loading.
+Models are cached per (language, configuration) to avoid redundant loading;
+the caches are shared by all threads, and loading is serialized.
+Unused components are excluded at load time so their weights are never
+read from disk.
 """
 
 from __future__ import annotations
 
 import subprocess
 import sys
+import threading
 
 from pgw.utils.console import stage, warning
 
@@ -74,10 +78,16 @@ SPACY_VOCAB_MODELS: dict[str, str] = {
     "zh": "zh_core_web_md",
 }
 
-# Separate caches for different configurations
-_cache_pos_only: dict[str, object] = {}
-_cache_with_lemma: dict[str, object] = {}
-_cache_with_parser: dict[str, object] = {}
+# Components no pgw caller reads.  ``senter`` is redundant with the parser
+# when sentence boundaries are wanted, and unused otherwise.
+_ALWAYS_EXCLUDE = ("ner", "senter", "textcat", "textcat_multilabel", "entity_ruler")
+
+# Separate caches for different configurations.  Keyed by language, or by
+# (language, exclude) when the caller overrides the excluded components.
+_cache_pos_only: dict[str | tuple[str, tuple[str, ...]], object] = {}
+_cache_with_lemma: dict[str | tuple[str, tuple[str, ...]], object] = {}
+_cache_with_parser: dict[str | tuple[str, tuple[str, ...]], object] = {}
+_cache_lock = threading.Lock()
 
 
 def _install_spacy_model(model_name: str) -> None:
@@ -92,15 +102,19 @@ def load_spacy_model(
     language: str,
     enable_lemmatizer: bool = False,
     enable_parser: bool = False,
+    exclude: list[str] | None = None,
 ):
     """Load a spaCy model, auto-downloading if needed.
 
     Args:
         language: ISO 639-1 language code (e.g. "fr", "en").
         enable_lemmatizer: If True, keeps the lemmatizer enabled (for vocab
-            analysis). If False, disables it for faster POS-only processing.
+            analysis). If False, excludes it for faster POS-only processing.
         enable_parser: If True, keeps the parser enabled (for sentence
-            boundary detection). If False, disables it for faster processing.
+            boundary detection). If False, excludes it for faster processing.
+        exclude: Explicit list of pipeline components to exclude, replacing
+            the defaults derived from the flags above. For callers that
+            need a component pgw normally drops (e.g. ``ner``).
 
     Returns:
         The loaded spaCy Language model, or None if spaCy is not installed
@@ -113,13 +127,35 @@ def load_spacy_model(
     else:
         cache = _cache_pos_only
 
-    if language in cache:
-        return cache[language]
+    if exclude is None:
+        exclude = list(_ALWAYS_EXCLUDE)
+        if not enable_parser:
+            exclude.append("parser")
+        if not enable_lemmatizer:
+            # attribute_ruler stays: some models (e.g. English) derive
+            # POS tags from it rather than from the tagger.
+            exclude.append("lemmatizer")
+        key: str | tuple[str, tuple[str, ...]] = language
+    else:
+        key = (language, tuple(sorted(exclude)))
+
+    # Fast path without the lock; dict reads are atomic under the GIL.
+    if key in cache:
+        return cache[key]
 
+    # Server jobs run in threads: serialize loading so two jobs needing
+    # the same model don't both download it or hold two copies in memory.
+    with _cache_lock:
+        if key not in cache:
+            cache[key] = _load_model(language, enable_lemmatizer, exclude)
+        return cache[key]
+
+
+def _load_model(language: str, enable_lemmatizer: bool, exclude: list[str]):
+    """Load (installing if needed) the model for *language*, or None."""
     try:
         import spacy
     except ImportError:
-        cache[language] = None
         return None
 
     # Use larger _md models for vocab analysis (better lemmatization)
@@ -128,42 +164,32 @@ def load_spacy_model(
     else:
         model_name = SPACY_MODELS.get(language)
     if model_name is None:
-        cache[language] = None
         return None
 
-    disable = ["ner"]
-    if not enable_parser:
-        disable.append("parser")
-    if not enable_lemmatizer:
-        disable.append("lemmatizer")
-
     try:
-        nlp = spacy.load(model_name, disable=disable)
+        nlp = spacy.load(model_name, exclude=exclude)
     except OSError:
         # Model not installed — auto-download
         stage("Downloading spaCy model", model_name)
         try:
             _install_spacy_model(model_name)
-            nlp = spacy.load(model_name, disable=disable)
+            nlp = spacy.load(model_name, exclude=exclude)
         except (SystemExit, Exception):
             # _md model may not exist; fall back to _sm
             fallback = SPACY_MODELS.get(language)
             if fallback and fallback != model_name:
                 try:
-                    nlp = spacy.load(fallback, disable=disable)
+                    nlp = spacy.load(fallback, exclude=exclude)
                 except OSError:
                     stage("Downloading spaCy model", fallback)
                     try:
                         _install_spacy_model(fallback)
-                        nlp = spacy.load(fallback, disable=disable)
+                        nlp = spacy.load(fallback, exclude=exclude)
                     except (SystemExit, Exception):
                         warning(f"Could not load spaCy model {fallback}, skipping.")
-                        cache[language] = None
                         return None
             else:
                 warning(f"Could not load spaCy model {model_name}, skipping.")
-                cache[language] = None
                 return None
 
-    cache[language] = nlp
     return nlp
@@ -8,25 +8,33 @@ official CEFR levels.
 
 from __future__ import annotations
 
-from collections import Counter
+from bisect import bisect_left
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from pgw.core.models import SubtitleSegment
 from pgw.utils.spacy import load_spacy_model
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # POS tags to skip during vocabulary extraction
 _SKIP_POS = {"PUNCT", "SPACE", "NUM", "SYM", "X", "PROPN"}
 
 # Difficulty tiers based on wordfreq zipf_frequency values.
 # zipf ≈ log10(frequency_per_billion). Higher = more common.
 # These are frequency-based approximations, not official CEFR levels.
-_DIFFICULTY_BINS = [
-    (5.0, "A1"),  # very common: the, is, I, de, le
-    (4.0, "A2"),  # common: house, eat, big
-    (3.0, "B1"),  # intermediate: opportunity, develop
-    (2.0, "B2"),  # upper-intermediate: comprehensive, deteriorate
-    (1.0, "C1"),  # advanced: ubiquitous, ephemeral
-]
+#   > 5.0  A1  very common: the, is, I, de, le
+#   > 4.0  A2  common: house, eat, big
+#   > 3.0  B1  intermediate: opportunity, develop
+#   > 2.0  B2  upper-intermediate: comprehensive, deteriorate
+#   > 1.0  C1  advanced: ubiquitous, ephemeral
+#   else   C2
+# Thresholds ascend so a bisect (or np.digitize) counting how many a zipf
+# strictly exceeds indexes straight into the tiers from hardest to easiest.
+_DIFFICULTY_THRESHOLDS = (1.0, 2.0, 3.0, 4.0, 5.0)
+_DIFFICULTY_BY_BIN = ("C2", "C1", "B2", "B1", "A2", "A1")
 
 _DIFFICULTY_ORDER = {"A1": 1, "A2": 2, "B1": 3, "B2": 4, "C1": 5, "C2": 6}
 
@@ -44,11 +52,12 @@ _MIN_ZIPF = 0.5
 _COMPREHENSION_THRESHOLD = 0.95
 
 
-def _is_learnable(token) -> bool:
-    """Return True if the token is learnable vocabulary (not an artifact)."""
-    if token.pos_ in _SKIP_POS or token.is_space:
-        return False
-    text = token.text.strip()
+def _is_learnable_text(text: str) -> bool:
+    """Return True if a token's text looks like learnable vocabulary.
+
+    POS and whitespace filtering happen beforehand, vectorized per doc.
+    """
+    text = text.strip()
     if not text or len(text) <= 1:
         return False
     # Skip all-caps abbreviations (JU, USA, etc.)
@@ -64,10 +73,27 @@ def _is_learnable(token) -> bool:
 
 def zipf_to_difficulty(zipf: float) -> str:
     """Map a wordfreq zipf_frequency value to an estimated difficulty tier."""
-    for threshold, level in _DIFFICULTY_BINS:
-        if zipf > threshold:
-            return level
-    return "C2"
+    return _DIFFICULTY_BY_BIN[bisect_left(_DIFFICULTY_THRESHOLDS, zipf)]
+
+
+def _difficulty_bins(zipfs: np.ndarray) -> np.ndarray:
+    """Index each zipf into ``_DIFFICULTY_BY_BIN`` in one vectorized pass."""
+    import numpy as np
+
+    # right=True → bin i means thresholds[i-1] < zipf <= thresholds[i],
+    # matching the strict ``zipf > threshold`` test in zipf_to_difficulty.
+    return np.digitize(zipfs, _DIFFICULTY_THRESHOLDS, right=True)
+
+
+def zipf_to_difficulty_batch(zipfs: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Vectorized :func:`zipf_to_difficulty` returning an array of tier labels.
+
+    Requires numpy (installed alongside spaCy).
+    """
+    import numpy as np
+
+    bins = _difficulty_bins(np.asarray(zipfs, dtype=np.float64))
+    return np.asarray(_DIFFICULTY_BY_BIN)[bins]
 
 
 @dataclass
@@ -110,17 +136,28 @@ def generate_vocab_summary(
     if nlp is None:
         raise RuntimeError(f"No spaCy model available for language '{language}'")
 
+    # numpy ships with spaCy, so both are importable at this point.
+    import numpy as np
+    from spacy.attrs import IS_SPACE, POS
+    from spacy.parts_of_speech import IDS as POS_IDS
+
+    skip_pos_ids = np.array([int(POS_IDS[p]) for p in _SKIP_POS], dtype=np.uint64)
+
     texts = [seg.text for seg in segments]
     trans_texts = [seg.text for seg in translated_segments] if translated_segments else None
 
     # Track unique lemmas and their info
     lemma_key_to_info: dict[tuple[str, str], WordInfo] = {}  # (lemma, pos) → WordInfo
     total_words = 0
-    difficulty_counts: Counter[str] = Counter()
 
     for doc_idx, doc in enumerate(nlp.pipe(texts, batch_size=50)):
-        for token in doc:
-            if not _is_learnable(token):
+        # Drop skipped POS and whitespace tokens in one array pass instead
+        # of a pos_/is_space lookup per token.
+        attrs = doc.to_array([POS, IS_SPACE])
+        keep = ~np.isin(attrs[:, 0], skip_pos_ids) & (attrs[:, 1] == 0)
+        for i in np.flatnonzero(keep).tolist():
+            token = doc[i]
+            if not _is_learnable_text(token.text):
                 continue
 
             total_words += 1
@@ -132,7 +169,8 @@ def generate_vocab_summary(
                 lemma_key_to_info[key].count += 1
                 continue
 
-            # First occurrence — compute frequency and difficulty tier.
+            # First occurrence — compute frequency; tiers are assigned in
+            # one vectorized pass once every unique lemma has been seen.
             # Use max(lemma, surface) because small spaCy models often
             # produce truncated lemmas (idée→ider, vivre→vivr) that match
             # obscure words with very low zipf, inflating difficulty.
@@ -144,8 +182,6 @@ def generate_vocab_summary(
                 lemma = surface  # prefer surface form when lemma is wrong
             else:
                 zipf = zipf_lemma
-            difficulty = zipf_to_difficulty(zipf)
-            difficulty_counts[difficulty] += 1
 
             context = texts[doc_idx]
             translation = trans_texts[doc_idx] if trans_texts and doc_idx < len(trans_texts) else ""
@@ -155,12 +191,21 @@ def generate_vocab_summary(
                 lemma=lemma,
                 pos=pos,
                 zipf=zipf,
-                difficulty=difficulty,
+                difficulty="",
                 count=1,
                 context=context,
                 translation=translation,
             )
 
+    infos = list(lemma_key_to_info.values())
+    zipfs = np.fromiter((info.zipf for info in infos), dtype=np.float64, count=len(infos))
+    counts = np.fromiter((info.count for info in infos), dtype=np.int64, count=len(infos))
+    bins = _difficulty_bins(zipfs)
+    for info, b in zip(infos, bins.tolist()):
+        info.difficulty = _DIFFICULTY_BY_BIN[b]
+    # Reverse bincount order (C2..A1) into _DIFFICULTY_ORDER (A1..C2)
+    difficulty_counts = np.bincount(bins, minlength=len(_DIFFICULTY_BY_BIN))[::-1]
+
     # Estimate difficulty via comprehension threshold: find the lowest
     # difficulty tier at which a learner would know ≥95% of the word tokens.
     # A learner at tier L is assumed to know all words at tier ≤L.
@@ -169,20 +214,19 @@ def generate_vocab_summary(
     estimated_difficulty = "A1"
     coverage: dict[str, float] = {}
     token_distribution: dict[str, int] = {}
-    if lemma_key_to_info:
+    if infos:
         # Count tokens per difficulty tier (with repetition)
-        level_tokens: Counter[str] = Counter()
-        for info in lemma_key_to_info.values():
-            if info.zipf >= _MIN_ZIPF:
-                level_tokens[info.difficulty] += info.count
-        known_pool = sum(level_tokens.values())
+        real = zipfs >= _MIN_ZIPF
+        level_tokens = np.bincount(
+            bins[real], weights=counts[real], minlength=len(_DIFFICULTY_BY_BIN)
+        )[::-1].astype(np.int64)
+        known_pool = int(level_tokens.sum())
         if known_pool > 0:
-            cumulative = 0
-            for level in _DIFFICULTY_ORDER:
-                cumulative += level_tokens.get(level, 0)
-                pct = round(cumulative / known_pool, 4)
+            cumulative = np.cumsum(level_tokens).tolist()
+            for level, tokens, cum in zip(_DIFFICULTY_ORDER, level_tokens.tolist(), cumulative):
+                pct = round(cum / known_pool, 4)
                 coverage[level] = pct
-                token_distribution[level] = level_tokens.get(level, 0)
+                token_distribution[level] = tokens
                 if pct >= _COMPREHENSION_THRESHOLD and estimated_difficulty == "A1":
                     estimated_difficulty = level
             if estimated_difficulty == "A1" and coverage.get("C2", 0) < _COMPREHENSION_THRESHOLD:
@@ -199,9 +243,7 @@ def generate_vocab_summary(
         "total_words": total_words,
         "unique_words": len({info.word.lower() for info in lemma_key_to_info.values()}),
         "unique_lemmas": len(lemma_key_to_info),
-        "difficulty_distribution": {
-            level: difficulty_counts.get(level, 0) for level in _DIFFICULTY_ORDER
-        },
+        "difficulty_distribution": dict(zip(_DIFFICULTY_ORDER, difficulty_counts.tolist())),
         "token_distribution": token_distribution,
         "coverage": coverage,
         "estimated_difficulty": estimated_difficulty,
@@ -50,6 +50,67 @@ def make_segments(texts: list[str], duration: float = 1.0) -> list[SubtitleSegme
     ]
 
 
+@pytest.fixture(scope="session")
+def default_config():
+    """Config from defaults alone, loaded once per session. Treat as read-only."""
+    from pgw.core.config import load_config
+
+    return load_config()
+
+
+@pytest.fixture(scope="session")
+def default_llm_config():
+    """Default ``LLMConfig``, built once per session. Treat as read-only."""
+    from pgw.core.config import LLMConfig
+
+    return LLMConfig()
+
+
+_SPACY_FIXTURES = frozenset({"fr_nlp", "it_nlp", "ca_nlp"})
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Mark tests that use a spaCy model fixture, so ``-m 'not spacy'`` drops them.
+
+    Under pytest-xdist every ``spacy`` test — fixture users and tests
+    marked by hand alike — also shares one ``xdist_group``, so
+    ``-n auto --dist loadgroup`` sends them all to a single worker and
+    each model is loaded once rather than once per worker.
+    """
+    group = config.pluginmanager.hasplugin("xdist")
+    for item in items:
+        if _SPACY_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.spacy)
+        if group and item.get_closest_marker("spacy") is not None:
+            item.add_marker(pytest.mark.xdist_group("spacy"))
+
+
+def _spacy_model_or_skip(language: str, name: str):
+    """Load a spaCy model once per process, or skip the requesting test."""
+    pytest.importorskip("spacy")
+    from pgw.utils.spacy import load_spacy_model
+
+    nlp = load_spacy_model(language)  # Memoized per language by pgw itself
+    if nlp is None:
+        pytest.skip(f"{name} spaCy model not available")
+    return nlp
+
+
+@pytest.fixture(scope="session")
+def fr_nlp():
+    return _spacy_model_or_skip("fr", "French")
+
+
+@pytest.fixture(scope="session")
+def it_nlp():
+    return _spacy_model_or_skip("it", "Italian")
+
+
+@pytest.fixture(scope="session")
+def ca_nlp():
+    return _spacy_model_or_skip("ca", "Catalan")
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     return FIXTURES_DIR
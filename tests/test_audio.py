@@ -0,0 +1,185 @@
+"""Audio extraction helpers in pgw.utils.audio."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import time
+import wave
+from pathlib import Path
+
+import pytest
+
+from pgw.utils import audio
+
+
+def _has_ffmpeg() -> bool:
+    return shutil.which("ffmpeg") is not None
+
+
+def _make_silence(path: Path, duration_s: float) -> Path:
+    """Write a silent mono WAV of *duration_s* seconds to *path*."""
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            f"anullsrc=r=8000:cl=mono:d={duration_s}",
+            str(path),
+        ],
+        check=True,
+    )
+    return path
+
+
+def _fake_extract(video_path, output_path=None, **kwargs):
+    """Stand-in for extract_audio: later jobs finish first, "bad" inputs fail."""
+    name = Path(video_path).stem
+    if name.startswith("bad"):
+        raise subprocess.CalledProcessError(1, ["ffmpeg"], stderr="boom")
+    time.sleep(0.05 if name == "a" else 0)
+    return output_path
+
+
+class TestExtractAudioBatch:
+    def test_results_follow_input_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audio, "extract_audio", _fake_extract)
+        jobs = [(tmp_path / f"{n}.mp4", tmp_path / f"{n}.wav") for n in ("a", "b", "c")]
+
+        results = audio.extract_audio_batch(jobs, max_workers=3)
+
+        assert results == [(out, False) for _, out in jobs]
+
+    def test_return_exceptions_keeps_failures_in_place(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audio, "extract_audio", _fake_extract)
+        jobs = [(tmp_path / f"{n}.mp4", tmp_path / f"{n}.wav") for n in ("a", "bad", "c")]
+
+        results = audio.extract_audio_batch(jobs, return_exceptions=True)
+
+        assert results[0] == (jobs[0][1], False)
+        assert isinstance(results[1], subprocess.CalledProcessError)
+        assert results[2] == (jobs[2][1], False)
+
+    def test_failure_raises_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audio, "extract_audio", _fake_extract)
+        jobs = [(tmp_path / f"{n}.mp4", tmp_path / f"{n}.wav") for n in ("a", "bad")]
+
+        with pytest.raises(subprocess.CalledProcessError):
+            audio.extract_audio_batch(jobs)
+
+    def test_empty_jobs(self):
+        assert audio.extract_audio_batch([]) == []
+
+
+class TestExtractAudioStream:
+    @pytest.mark.skipif(not _has_ffmpeg(), reason="ffmpeg not installed")
+    def test_yields_wav_bytes(self, tmp_path):
+        source = _make_silence(tmp_path / "in.wav", duration_s=1.0)
+
+        data = b"".join(audio.extract_audio_stream(source, chunk_size=4096))
+
+        assert data[:4] == b"RIFF"
+        assert data[8:12] == b"WAVE"
+        # 1 s of 16 kHz mono s16le after the header
+        assert len(data) >= 16000 * 2
+
+    def test_missing_source_raises_on_call(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audio, "check_ffmpeg", lambda: True)
+
+        with pytest.raises(FileNotFoundError, match="Video file not found"):
+            audio.extract_audio_stream(tmp_path / "missing.mp4")
+
+    @pytest.mark.skipif(not _has_ffmpeg(), reason="ffmpeg not installed")
+    def test_early_close_kills_ffmpeg(self, tmp_path, monkeypatch):
+        # 60 s of output is far more than a pipe buffers, so ffmpeg is
+        # still blocked writing when the consumer walks away.
+        source = _make_silence(tmp_path / "in.wav", duration_s=60.0)
+        procs = []
+        real_popen = subprocess.Popen
+
+        def spy_popen(*args, **kwargs):
+            proc = real_popen(*args, **kwargs)
+            procs.append(proc)
+            return proc
+
+        monkeypatch.setattr(subprocess, "Popen", spy_popen)
+
+        stream = audio.extract_audio_stream(source, chunk_size=4096)
+        assert next(stream)[:4] == b"RIFF"
+        stream.close()
+
+        assert len(procs) == 1
+        assert procs[0].returncode is not None
+        assert procs[0].returncode != 0
+
+
+_OUTPUT_ARGS = ["-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", "-map_metadata", "-1"]
+
+
+class TestFfmpegAudioCmd:
+    def test_defaults(self):
+        cmd = audio._ffmpeg_audio_cmd("in.mp4", 16000, None, None)
+
+        assert cmd == ["ffmpeg", "-i", "in.mp4", *_OUTPUT_ARGS]
+
+    def test_demuxer_knobs_precede_input(self):
+        cmd = audio._ffmpeg_audio_cmd(
+            "in.mp4", 16000, None, None, probesize=32768, analyzeduration=0, threads=2
+        )
+
+        assert cmd == [
+            "ffmpeg",
+            "-probesize",
+            "32768",
+            "-analyzeduration",
+            "0",
+            "-threads",
+            "2",
+            "-i",
+            "in.mp4",
+            *_OUTPUT_ARGS,
+        ]
+
+    def test_clip_window_is_an_input_option(self):
+        cmd = audio._ffmpeg_audio_cmd("in.mp4", 16000, "00:01:00", "30")
+
+        assert cmd == ["ffmpeg", "-ss", "00:01:00", "-t", "30", "-i", "in.mp4", *_OUTPUT_ARGS]
+
+    def test_keyframe_seek(self):
+        cmd = audio._ffmpeg_audio_cmd("in.mp4", 16000, "60", None, accurate_seek=False)
+
+        assert cmd == ["ffmpeg", "-noaccurate_seek", "-ss", "60", "-i", "in.mp4", *_OUTPUT_ARGS]
+        # Without a seek there is nothing to relax.
+        no_seek = audio._ffmpeg_audio_cmd("in.mp4", 16000, None, "30", accurate_seek=False)
+        assert "-noaccurate_seek" not in no_seek
+
+
+class TestExtractAudioClips:
+    @pytest.mark.skipif(not _has_ffmpeg(), reason="ffmpeg not installed")
+    def test_cuts_each_window(self, tmp_path):
+        source = _make_silence(tmp_path / "in.wav", duration_s=3.0)
+        first = tmp_path / "clips" / "first.wav"
+        second = tmp_path / "clips" / "second.wav"
+
+        # Out of order on purpose: the shared seek goes to the earliest clip.
+        outputs = audio.extract_audio_clips(source, [(2.0, 0.5, first), (0.5, 1.0, second)])
+
+        assert outputs == [first, second]
+        for path, seconds in ((first, 0.5), (second, 1.0)):
+            with wave.open(str(path)) as w:
+                assert w.getframerate() == 16000
+                assert w.getnchannels() == 1
+                assert w.getnframes() == pytest.approx(16000 * seconds, abs=160)
+
+    def test_no_clips(self, tmp_path):
+        assert audio.extract_audio_clips(tmp_path / "missing.mp4", []) == []
+
+    def test_missing_source_raises(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audio, "check_ffmpeg", lambda: True)
+
+        with pytest.raises(FileNotFoundError, match="Video file not found"):
+            audio.extract_audio_clips(tmp_path / "missing.mp4", [(0.0, 1.0, tmp_path / "a.wav")])
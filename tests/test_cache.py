@@ -2,8 +2,9 @@
 
 import json
 import os
+from pathlib import Path
 
-from pgw.utils.cache import atomic_write_text, find_cached_file
+from pgw.utils.cache import atomic_write_text, find_cached_file, link_cached_file, link_or_copy
 
 
 class TestAtomicWriteText:
@@ -45,6 +46,157 @@ class TestAtomicWriteText:
         assert path.read_text() == "new"
 
 
+class TestFileHashIndex:
+    def test_index_skips_rehash_until_file_changes(self, tmp_path, monkeypatch):
+        import hashlib
+
+        from pgw.utils import cache
+
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"frame")
+        index = tmp_path / "hashes"
+        digest = cache.file_hash(video, index_dir=index)
+        assert digest == hashlib.sha256(b"frame").hexdigest()
+
+        calls = []
+        real_sha256 = hashlib.sha256
+        monkeypatch.setattr(cache.hashlib, "sha256", lambda *a: calls.append(1) or real_sha256(*a))
+        assert cache.file_hash(video, index_dir=index) == digest
+        assert calls == []
+
+        video.write_bytes(b"other frame")
+        assert cache.file_hash(video, index_dir=index) == real_sha256(b"other frame").hexdigest()
+        assert calls == [1]
+
+
+class TestCacheKey:
+    def test_metadata_key_tracks_file_changes(self, tmp_path):
+        """Memoized path resolution must not freeze size/mtime in the key."""
+        from pgw.utils.cache import cache_key
+
+        f = tmp_path / "audio.wav"
+        f.write_bytes(b"a")
+        first = cache_key(f, sample_rate=16000)
+        assert cache_key(f, sample_rate=16000) == first
+
+        f.write_bytes(b"longer")
+        os.utime(f, ns=(1, 1))
+        assert cache_key(f, sample_rate=16000) != first
+
+    def test_relative_and_absolute_paths_match(self, tmp_path, monkeypatch):
+        from pgw.utils.cache import cache_key
+
+        (tmp_path / "audio.wav").write_bytes(b"a")
+        monkeypatch.chdir(tmp_path)
+        assert cache_key(Path("audio.wav")) == cache_key(tmp_path / "audio.wav")
+
+
+def _no_link(*args, **kwargs):
+    raise OSError(18, "Invalid cross-device link")
+
+
+class TestLinkOrCopy:
+    def test_hardlinks_when_possible(self, tmp_path):
+        src = tmp_path / "cache" / "a.wav"
+        src.parent.mkdir()
+        src.write_bytes(b"audio")
+        dest = tmp_path / "ws" / "audio.wav"
+        link_or_copy(src, dest)
+        assert not dest.is_symlink()
+        assert os.path.samefile(src, dest)
+
+    def test_falls_back_to_symlink(self, tmp_path, monkeypatch):
+        src = tmp_path / "a.wav"
+        src.write_bytes(b"audio")
+        dest = tmp_path / "ws" / "audio.wav"
+        monkeypatch.setattr(os, "link", _no_link)
+        link_or_copy(src, dest)
+        assert dest.is_symlink()
+        assert os.readlink(dest) == os.path.join("..", "a.wav")
+        assert dest.read_bytes() == b"audio"
+
+    def test_absolute_symlink_opt_out(self, tmp_path, monkeypatch):
+        src = tmp_path / "a.wav"
+        src.write_bytes(b"audio")
+        dest = tmp_path / "ws" / "audio.wav"
+        monkeypatch.setattr(os, "link", _no_link)
+        link_or_copy(src, dest, relative=False)
+        assert os.readlink(dest) == str(src.resolve())
+
+
+class TestLinkCachedFile:
+    def test_hit_links_entry(self, tmp_path):
+        from pgw.utils.cache import cache_key
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        entry = cache_dir / f"{cache_key(content_hash='abc', sample_rate=16000)}.wav"
+        entry.write_bytes(b"audio")
+        dest = tmp_path / "ws" / "audio.wav"
+
+        assert link_cached_file(cache_dir, ".wav", dest, content_hash="abc", sample_rate=16000)
+        assert dest.read_bytes() == b"audio"
+
+    def test_miss_returns_false(self, tmp_path):
+        dest = tmp_path / "ws" / "audio.wav"
+        assert not link_cached_file(tmp_path, ".wav", dest, content_hash="abc")
+        assert not dest.exists()
+
+    def test_existing_dest_falls_back(self, tmp_path):
+        from pgw.utils.cache import cache_key
+
+        entry = tmp_path / f"{cache_key(content_hash='abc')}.wav"
+        entry.write_bytes(b"audio")
+        dest = tmp_path / "ws" / "audio.wav"
+        dest.parent.mkdir()
+        os.symlink(tmp_path / "gone.wav", dest)  # stale link from an earlier run
+
+        assert link_cached_file(tmp_path, ".wav", dest, content_hash="abc")
+        assert dest.read_bytes() == b"audio"
+
+
+class TestFindCachedFileLegacyKey:
+    def test_finds_entry_written_under_sha256_key(self, tmp_path):
+        """Entries keyed by the pre-BLAKE2 digest are still cache hits."""
+        import hashlib
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        legacy = hashlib.sha256(b"abc123|sample_rate=16000").hexdigest()[:16]
+        entry = cache_dir / f"{legacy}.wav"
+        entry.write_bytes(b"audio")
+
+        result = find_cached_file(cache_dir, ".wav", content_hash="abc123", sample_rate=16000)
+        assert result == entry
+
+    def test_finds_transcription_written_before_blake2(self, tmp_path):
+        """A nested audio identity keeps its old format, so pre-upgrade entries hit."""
+        import hashlib
+
+        from pgw.utils.cache import content_identity
+
+        def sha16(base: str) -> str:
+            return hashlib.sha256(base.encode()).hexdigest()[:16]
+
+        # Keys as the pipeline derived them before the switch: SHA-256 all the way down
+        identity = sha16("abc123|duration=None|sample_rate=16000|start=None")
+        legacy = sha16(f"{identity}|backend=local|model=large-v3-turbo")
+        cache_dir = tmp_path / "transcriptions"
+        cache_dir.mkdir()
+        entry = cache_dir / f"{legacy}.json"
+        entry.write_text("[]")
+
+        audio_identity = content_identity("abc123", sample_rate=16000, start=None, duration=None)
+        result = find_cached_file(
+            cache_dir,
+            ".json",
+            content_hash=audio_identity,
+            model="large-v3-turbo",
+            backend="local",
+        )
+        assert result == entry
+
+
 class TestFindCachedFileBrokenSymlink:
     def test_removes_broken_symlink(self, tmp_path):
         """Broken symlinks in cache dir should be cleaned up, not returned."""
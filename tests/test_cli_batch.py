@@ -1,5 +1,7 @@
 """Tests for CLI batch utilities and config override logic."""
 
+from pathlib import Path
+
 from pgw.cli.utils import build_config_overrides, expand_inputs
 
 
@@ -93,3 +95,23 @@ def test_build_config_overrides_translate():
 def test_build_config_overrides_subs():
     overrides = build_config_overrides(language="en", device="cpu", subs=True)
     assert overrides["download.subtitles"] is True
+
+
+def test_prepare_batch_audio_skips_colliding_wav_targets(tmp_path, monkeypatch):
+    """Two ffmpegs must never write the same WAV, nor overwrite an input."""
+    from pgw.cli import transcribe
+
+    names = ["lecture.mp4", "lecture.mkv", "talk.mp4", "talk.wav", "intro.mp4", "outro.webm"]
+    for name in names:
+        (tmp_path / name).touch()
+    submitted = []
+
+    def fake_batch(jobs, **kwargs):
+        submitted.extend(jobs)
+        return [(out, False) for _, out in jobs]
+
+    monkeypatch.setattr(transcribe, "extract_audio_batch", fake_batch)
+    prepared = transcribe._prepare_batch_audio([str(tmp_path / n) for n in names], None, None)
+
+    assert [video.name for video, _ in submitted] == ["intro.mp4", "outro.webm"]
+    assert sorted(Path(p).name for p in prepared) == ["intro.mp4", "outro.webm"]
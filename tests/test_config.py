@@ -20,11 +20,10 @@ def test_cli_overrides():
     assert config.whisper.language == "de"
 
 
-def test_cli_override_none_ignored():
+def test_cli_override_none_ignored(default_config):
     """None values in CLI overrides are ignored, defaults preserved."""
-    default = load_config()
     overridden = load_config(**{"whisper.local_model": None})
-    assert overridden.whisper.local_model == default.whisper.local_model
+    assert overridden.whisper.local_model == default_config.whisper.local_model
 
 
 def test_model_property_selects_backend():
@@ -45,6 +44,16 @@ def test_llm_model_property_selects_backend():
     assert api.llm.model == api.llm.api_model
 
 
+def test_dot_path_overrides_share_nested_tables():
+    """Sibling dotted keys land in one nested dict; None values are dropped."""
+    from pgw.core.config import _expand_dot_paths
+
+    nested = _expand_dot_paths(
+        {"llm.backend": "api", "llm.temperature": 0.5, "whisper.device": None, "workspace_dir": "w"}
+    )
+    assert nested == {"llm": {"backend": "api", "temperature": 0.5}, "workspace_dir": "w"}
+
+
 @pytest.fixture
 def env_isolation(monkeypatch):
     """Strip any PGW_* env vars so test cases start from a clean slate."""
@@ -102,6 +111,26 @@ def test_project_toml_partial_override(tmp_path, env_isolation, monkeypatch):
     assert config.llm.api_base == "http://localhost:11434/v1"
 
 
+def test_project_toml_edit_is_picked_up(tmp_path, env_isolation, monkeypatch):
+    """Parsed TOML is memoized, but an edited file is re-read."""
+    monkeypatch.chdir(tmp_path)
+    Path("pgw.toml").write_text("[llm]\ntemperature = 0.9\n", encoding="utf-8")
+    assert load_config().llm.temperature == 0.9
+    Path("pgw.toml").write_text("[llm]\ntemperature = 0.25\n", encoding="utf-8")
+    assert load_config().llm.temperature == 0.25
+
+
+def test_loaded_toml_is_a_private_copy(tmp_path):
+    """Mutating one load's result must not leak into the memoized parse."""
+    from pgw.core.config import _load_toml
+
+    path = tmp_path / "pgw.toml"
+    path.write_text("[llm]\ntemperature = 0.9\n", encoding="utf-8")
+    first = _load_toml(path)
+    first["llm"]["temperature"] = 0.1
+    assert _load_toml(path)["llm"]["temperature"] == 0.9
+
+
 def test_chunk_size_precedence(tmp_path, env_isolation, monkeypatch):
     """CLI > env > TOML > auto for the new ``llm.chunk_size`` field."""
     from pgw.llm.translator import _chunk_params
@@ -135,7 +164,6 @@ def test_cli_refine_overrides_refine_enabled():
     assert config.llm.refine_enabled is True
 
 
-def test_cli_refine_false_leaves_default():
+def test_cli_refine_false_leaves_default(default_config):
     """Without --refine, refine_enabled stays at default (False)."""
-    config = load_config()
-    assert config.llm.refine_enabled is False
+    assert default_config.llm.refine_enabled is False
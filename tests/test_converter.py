@@ -1,5 +1,6 @@
 """Tests for subtitle converter."""
 
+import io
 from pathlib import Path
 
 import pytest
@@ -12,54 +13,58 @@ from pgw.subtitles.converter import (
     save_bilingual_vtt,
     save_subtitles,
 )
-from pgw.utils.spacy import load_spacy_model
 
 
-def test_save_and_load_vtt_roundtrip(tmp_path: Path):
-    """VTT save/load roundtrip preserves text and segment count."""
-    segments = [
-        SubtitleSegment(text="Bonjour", start=1.0, end=4.0),
-        SubtitleSegment(text="Monde", start=4.5, end=8.0),
+def _pair(first: str, second: str) -> list[SubtitleSegment]:
+    """Two fresh segments at 1.0–4.0 s and 4.5–8.0 s, safe for a test to mutate."""
+    return [
+        SubtitleSegment(text=first, start=1.0, end=4.0),
+        SubtitleSegment(text=second, start=4.5, end=8.0),
     ]
-    vtt_path = tmp_path / "test.vtt"
-    save_subtitles(segments, vtt_path, fmt="vtt")
-    assert vtt_path.exists()
-
-    loaded = load_subtitles(vtt_path)
-    assert len(loaded) == len(segments)
-    for orig, ld in zip(segments, loaded):
-        assert ld.text == orig.text
 
 
-def test_save_and_load_txt(tmp_path: Path):
-    """TXT save/load preserves text content."""
-    segments = [
-        SubtitleSegment(text="Hello", start=0.0, end=1.0),
-        SubtitleSegment(text="World", start=1.0, end=2.0),
-    ]
-    txt_path = tmp_path / "test.txt"
-    save_subtitles(segments, txt_path, fmt="txt")
-    assert txt_path.exists()
+@pytest.mark.parametrize("fmt", ["srt", "vtt", "txt"])
+def test_save_and_load_roundtrip(tmp_path: Path, fmt: str):
+    """Save/load roundtrip preserves text and segment count."""
+    path = save_subtitles(_pair("Bonjour", "Monde"), tmp_path / f"test.{fmt}", fmt=fmt)
+    assert path.exists()
 
-    loaded = load_subtitles(txt_path)
-    assert len(loaded) == len(segments)
-    assert loaded[0].text == "Hello"
-    assert loaded[1].text == "World"
+    loaded = load_subtitles(path)
+    assert [seg.text for seg in loaded] == ["Bonjour", "Monde"]
 
 
-def test_save_txt_skips_empty(tmp_path: Path):
+def test_save_txt_skips_empty():
     """TXT output omits empty segments."""
     segments = [
         SubtitleSegment(text="Line one", start=0.0, end=1.0),
         SubtitleSegment(text="", start=1.0, end=2.0),
         SubtitleSegment(text="Line three", start=2.0, end=3.0),
     ]
-    txt_path = tmp_path / "test.txt"
-    save_subtitles(segments, txt_path, fmt="txt")
-    loaded = load_subtitles(txt_path)
+    buf = io.StringIO()
+    save_subtitles(segments, buf, fmt="txt")
+    buf.seek(0)
+    loaded = load_subtitles(buf, fmt="txt")
     assert len(loaded) == 2
 
 
+@pytest.mark.parametrize("fmt", ["srt", "vtt"])
+def test_save_and_load_stream(fmt: str):
+    """Subtitle formats roundtrip through an in-memory text stream."""
+    buf = io.StringIO()
+    save_subtitles(_pair("Bonjour", "Monde"), buf, fmt=fmt)
+    buf.seek(0)
+    loaded = load_subtitles(buf, fmt=fmt)
+    assert [(seg.text, seg.start, seg.end) for seg in loaded] == [
+        ("Bonjour", 1.0, 4.0),
+        ("Monde", 4.5, 8.0),
+    ]
+
+
+def test_load_stream_requires_format():
+    with pytest.raises(ValueError, match="fmt is required"):
+        load_subtitles(io.StringIO("Hello"))
+
+
 def test_load_sample_vtt(sample_vtt: Path):
     """Sample VTT fixture loads correctly."""
     segments = load_subtitles(sample_vtt)
@@ -69,16 +74,8 @@ def test_load_sample_vtt(sample_vtt: Path):
 
 def test_bilingual_vtt(tmp_path: Path):
     """Bilingual VTT contains both languages with positioning cues."""
-    original = [
-        SubtitleSegment(text="Bonjour", start=1.0, end=4.0),
-        SubtitleSegment(text="Monde", start=4.5, end=8.0),
-    ]
-    translated = [
-        SubtitleSegment(text="Hello", start=1.0, end=4.0),
-        SubtitleSegment(text="World", start=4.5, end=8.0),
-    ]
     bi_path = tmp_path / "bilingual.fr-en.vtt"
-    save_bilingual_vtt(original, translated, bi_path)
+    save_bilingual_vtt(_pair("Bonjour", "Monde"), _pair("Hello", "World"), bi_path)
     assert bi_path.exists()
 
     content = bi_path.read_text()
@@ -89,12 +86,11 @@ def test_bilingual_vtt(tmp_path: Path):
     assert "line:5%" in content
 
 
-def test_load_result_from_json(tmp_path: Path):
-    """Load segments from a stable-ts JSON result file via WhisperResult."""
+@pytest.fixture(scope="session")
+def stable_ts_result_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A minimal stable-ts JSON result, written once per session."""
     import json
 
-    stable_whisper = pytest.importorskip("stable_whisper")
-
     data = {
         "segments": [
             {
@@ -121,10 +117,16 @@ def test_load_result_from_json(tmp_path: Path):
         "text": " Bonjour le monde Comment allez-vous",
         "language": "fr",
     }
-    json_path = tmp_path / "transcription.json"
+    json_path = tmp_path_factory.mktemp("stable_ts") / "transcription.json"
     json_path.write_text(json.dumps(data), encoding="utf-8")
+    return json_path
+
+
+def test_load_result_from_json(stable_ts_result_path: Path):
+    """Load segments from a stable-ts JSON result file via WhisperResult."""
+    stable_whisper = pytest.importorskip("stable_whisper")
 
-    result = stable_whisper.WhisperResult(str(json_path))
+    result = stable_whisper.WhisperResult(str(stable_ts_result_path))
     segments = result_to_segments(result)
     assert len(segments) == 2
     assert segments[0].text == "Bonjour le monde"  # stripped
@@ -170,30 +172,34 @@ def test_format_vtt_time(seconds, expected):
 
 
 # --- Tests for fix_dangling_clitics (spaCy-based, in postprocess) ---
+# fr_nlp / it_nlp / ca_nlp are session fixtures in conftest.py.
 
-spacy = pytest.importorskip("spacy")
 
-
-@pytest.fixture(scope="module")
-def fr_nlp():
-    nlp = load_spacy_model("fr")
-    if nlp is None:
-        pytest.skip("French spaCy model not available")
-    return nlp
-
-
-def test_fix_dangling_clitics_trailing_apostrophe(fr_nlp):
-    """Trailing token ending with apostrophe (l') is moved to next segment."""
+# The model fixture is requested by name at run time, so the conftest hook
+# can't see it: mark explicitly so ``-m 'not spacy'`` deselects every case.
+@pytest.mark.spacy
+@pytest.mark.parametrize(
+    "language, text, clitic, following",
+    [
+        ("fr", "C'est de l'", "l'", "école primaire"),
+        ("it", "la storia dell'", "dell'", "uomo moderno"),
+        ("ca", "Aquesta és l'", "l'", "escola"),
+    ],
+    ids=["french", "italian", "catalan"],
+)
+def test_fix_dangling_clitics_trailing_apostrophe(request, language, text, clitic, following):
+    """Trailing elided clitic (l', dell') is moved to the next segment."""
     from pgw.transcriber.postprocess import fix_dangling_clitics
 
+    request.getfixturevalue(f"{language}_nlp")  # Skips if the model is unavailable
     segments = [
-        SubtitleSegment(text="C'est de l'", start=0.0, end=2.0),
-        SubtitleSegment(text="école primaire", start=2.0, end=4.0),
+        SubtitleSegment(text=text, start=0.0, end=2.0),
+        SubtitleSegment(text=following, start=2.0, end=4.0),
     ]
-    fixed = fix_dangling_clitics(segments, "fr")
+    fixed = fix_dangling_clitics(segments, language)
     assert len(fixed) == 2
-    assert "l'" not in fixed[0].text
-    assert fixed[1].text.startswith("l'")
+    assert clitic not in fixed[0].text
+    assert fixed[1].text.startswith(clitic)
 
 
 def test_fix_dangling_clitics_trailing_det(fr_nlp):
@@ -235,36 +241,6 @@ def test_fix_dangling_clitics_empty_after_removal(fr_nlp):
     assert "école" in fixed[0].text
 
 
-@pytest.fixture(scope="module")
-def it_nlp():
-    nlp = load_spacy_model("it")
-    if nlp is None:
-        pytest.skip("Italian spaCy model not available")
-    return nlp
-
-
-@pytest.fixture(scope="module")
-def ca_nlp():
-    nlp = load_spacy_model("ca")
-    if nlp is None:
-        pytest.skip("Catalan spaCy model not available")
-    return nlp
-
-
-def test_fix_dangling_clitics_italian_apostrophe(it_nlp):
-    """Italian elision: trailing l' in "dell'" is moved to next segment."""
-    from pgw.transcriber.postprocess import fix_dangling_clitics
-
-    segments = [
-        SubtitleSegment(text="la storia dell'", start=0.0, end=2.0),
-        SubtitleSegment(text="uomo moderno", start=2.0, end=4.0),
-    ]
-    fixed = fix_dangling_clitics(segments, "it")
-    assert len(fixed) == 2
-    assert "dell'" not in fixed[0].text
-    assert fixed[1].text.startswith("dell'")
-
-
 def test_fix_dangling_clitics_italian_det(it_nlp):
     """Italian trailing determiner (il, la, lo) is moved to next segment."""
     from pgw.transcriber.postprocess import fix_dangling_clitics
@@ -278,20 +254,6 @@ def test_fix_dangling_clitics_italian_det(it_nlp):
     assert "il" in fixed[1].text
 
 
-def test_fix_dangling_clitics_catalan_apostrophe(ca_nlp):
-    """Catalan elision: trailing l' is moved to next segment."""
-    from pgw.transcriber.postprocess import fix_dangling_clitics
-
-    segments = [
-        SubtitleSegment(text="Aquesta és l'", start=0.0, end=2.0),
-        SubtitleSegment(text="escola", start=2.0, end=4.0),
-    ]
-    fixed = fix_dangling_clitics(segments, "ca")
-    assert len(fixed) == 2
-    assert "l'" not in fixed[0].text
-    assert fixed[1].text.startswith("l'")
-
-
 def test_fix_dangling_clitics_no_spacy_model():
     """Unsupported language gracefully returns segments unchanged."""
     from pgw.transcriber.postprocess import fix_dangling_clitics
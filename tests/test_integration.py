@@ -4,9 +4,12 @@ Run with: pytest -m integration
 Skipped by default in CI and normal test runs.
 """
 
+import asyncio
+import functools
 import json
 import shutil
-import subprocess
+import socket
+from urllib.parse import urlsplit
 
 import pytest
 from conftest import make_segments
@@ -31,14 +34,20 @@ SPLIT_SENTENCE_SEGMENTS = [
 ]
 
 
+@functools.cache
 def ollama_available() -> bool:
-    """Check if Ollama is running and reachable."""
+    """Check if Ollama is running and reachable. Probed once per session.
+
+    The CLI must be installed (the session fixture pulls the model with it);
+    the server check is a plain TCP connect to the API port, not a subprocess.
+    """
     if not shutil.which("ollama"):
         return False
+    api = urlsplit(TEST_CONFIG.api_base)
     try:
-        result = subprocess.run(["ollama", "list"], capture_output=True, timeout=5)
-        return result.returncode == 0
-    except Exception:
+        with socket.create_connection((api.hostname, api.port or 80), timeout=1):
+            return True
+    except OSError:
         return False
 
 
@@ -56,27 +65,25 @@ def _ensure_test_model():
 
 
 @skip_no_ollama
-def test_refine_real():
+async def test_refine_and_translate_real():
+    """Refine and translate smoke tests, overlapped against the one loaded model."""
     from pgw.llm.refine import refine_subtitles
-
-    segments = make_segments(["Bonjour euh le monde", "il fait beau aujoud'hui"])
-    result = refine_subtitles(segments, "fr", TEST_CONFIG, chunk_size=5)
-
-    assert len(result) == len(segments)
-    for orig, refined in zip(segments, result):
-        assert refined.start == orig.start
-        assert refined.text  # non-empty
-
-
-@skip_no_ollama
-def test_translate_real():
     from pgw.llm.translator import translate_subtitles
 
-    segments = make_segments(["Bonjour", "Merci beaucoup"])
-    result = translate_subtitles(segments, "fr", "en", TEST_CONFIG, chunk_size=5)
+    to_refine = make_segments(["Bonjour euh le monde", "il fait beau aujoud'hui"])
+    to_translate = make_segments(["Bonjour", "Merci beaucoup"])
+    refined, translation = await asyncio.gather(
+        asyncio.to_thread(refine_subtitles, to_refine, "fr", TEST_CONFIG, chunk_size=5),
+        asyncio.to_thread(translate_subtitles, to_translate, "fr", "en", TEST_CONFIG, chunk_size=5),
+    )
 
-    assert len(result.translated) == len(segments)
-    for orig, trans in zip(segments, result.translated):
+    assert len(refined) == len(to_refine)
+    for orig, out in zip(to_refine, refined):
+        assert out.start == orig.start
+        assert out.text  # non-empty
+
+    assert len(translation.translated) == len(to_translate)
+    for orig, trans in zip(to_translate, translation.translated):
         assert trans.start == orig.start
         assert trans.text  # non-empty
 
@@ -86,7 +93,7 @@ def test_json_response_format():
     """Verify LLM returns valid JSON with the array format.
 
     Does NOT assert exact count — small models may merge segments.
-    Count enforcement via json_schema is tested by test_translate_real etc.
+    Count enforcement via json_schema is tested by test_refine_and_translate_real etc.
     """
     from pgw.llm.client import complete
     from pgw.llm.prompts import (
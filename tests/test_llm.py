@@ -2,10 +2,9 @@
 
 from unittest.mock import patch
 
+import pytest
 from conftest import make_segments
 
-from pgw.core.config import LLMConfig
-
 
 def _mock_complete(messages, config, **kwargs):
     """Mock LLM that returns a JSON object echoing back the input."""
@@ -35,54 +34,46 @@ def _mock_complete(messages, config, **kwargs):
     return "\n".join(f"{i + 1}. [processed] {text}" for i, text in enumerate(lines))
 
 
-class TestRefine:
-    @patch("pgw.llm.refine.complete", side_effect=_mock_complete)
-    def test_refine_preserves_timestamps(self, _mock):
+def _run_stage(stage: str, segments, config):
+    """Run refine or translate over ``segments`` and return the output segments."""
+    if stage == "refine":
         from pgw.llm.refine import refine_subtitles
 
-        segments = make_segments(["Hello", "World"])
-        result = refine_subtitles(segments, "fr", LLMConfig())
-
-        for orig, refined in zip(segments, result):
-            assert refined.start == orig.start
-            assert refined.end == orig.end
+        return refine_subtitles(segments, "fr", config)
 
-    @patch("pgw.llm.refine.complete", side_effect=Exception("LLM error"))
-    def test_refine_fallback_on_error(self, _mock):
-        from pgw.llm.refine import refine_subtitles
+    from pgw.llm.translator import translate_subtitles
 
-        segments = make_segments(["Keep this", "And this"])
-        result = refine_subtitles(segments, "fr", LLMConfig())
+    return translate_subtitles(segments, "fr", "en", config).translated
 
-        assert result[0].text == "Keep this"
-        assert result[1].text == "And this"
 
+def _raise_llm_error(messages, config, **kwargs):
+    raise Exception("LLM error")
 
-class TestTranslator:
-    @patch("pgw.llm.translator.complete", side_effect=_mock_complete)
-    def test_translate_preserves_timestamps(self, _mock):
-        from pgw.llm.translator import translate_subtitles
 
+@pytest.mark.parametrize("stage", ["refine", "translator"])
+class TestRefineAndTranslate:
+    def test_preserves_timestamps(self, stage, monkeypatch, default_llm_config):
+        monkeypatch.setattr(f"pgw.llm.{stage}.complete", _mock_complete)
         segments = make_segments(["Bonjour", "Monde"])
-        result = translate_subtitles(segments, "fr", "en", LLMConfig())
+        result = _run_stage(stage, segments, default_llm_config)
 
-        for orig, trans in zip(segments, result.translated):
-            assert trans.start == orig.start
-            assert trans.end == orig.end
-
-    @patch("pgw.llm.translator.complete", side_effect=Exception("LLM error"))
-    def test_translate_fallback_on_error(self, _mock):
-        from pgw.llm.translator import translate_subtitles
+        for orig, out in zip(segments, result):
+            assert out.start == orig.start
+            assert out.end == orig.end
 
+    def test_fallback_on_error(self, stage, monkeypatch, default_llm_config):
+        monkeypatch.setattr(f"pgw.llm.{stage}.complete", _raise_llm_error)
         segments = make_segments(["Bonjour", "Monde"])
-        result = translate_subtitles(segments, "fr", "en", LLMConfig())
+        result = _run_stage(stage, segments, default_llm_config)
 
         # On error, originals are returned (not marked since they're non-empty results)
-        assert result.translated[0].text == "Bonjour"
-        assert result.translated[1].text == "Monde"
+        assert result[0].text == "Bonjour"
+        assert result[1].text == "Monde"
 
+
+class TestTranslator:
     @patch("pgw.llm.translator.complete")
-    def test_translate_retry_before_split(self, mock_complete):
+    def test_translate_retry_before_split(self, mock_complete, default_llm_config):
         """On count mismatch, retry once before splitting."""
         from pgw.llm.translator import translate_subtitles
 
@@ -98,13 +89,13 @@ class TestTranslator:
 
         mock_complete.side_effect = _mock_retry
         segments = make_segments(["x", "y", "z"])
-        result = translate_subtitles(segments, "fr", "en", LLMConfig(), chunk_size=3)
+        result = translate_subtitles(segments, "fr", "en", default_llm_config, chunk_size=3)
         assert len(result.translated) == 3
         # First attempt + retry = 2 calls (no binary split)
         assert call_count == 2
 
     @patch("pgw.llm.translator.complete")
-    def test_translate_untranslated_marker(self, mock_complete):
+    def test_translate_untranslated_marker(self, mock_complete, default_llm_config):
         """Segments with empty translations get [?] prefix."""
         from pgw.llm.prompts import UNTRANSLATED_MARKER
         from pgw.llm.translator import translate_subtitles
@@ -112,6 +103,6 @@ class TestTranslator:
         # Return only 1 line when 2 expected — retry also returns 1
         mock_complete.return_value = "1. Hello"
         segments = make_segments(["Bonjour", "Monde"])
-        result = translate_subtitles(segments, "fr", "en", LLMConfig(), chunk_size=2)
+        result = translate_subtitles(segments, "fr", "en", default_llm_config, chunk_size=2)
         # Second segment should have untranslated marker
         assert result.translated[1].text.startswith(UNTRANSLATED_MARKER)
@@ -1,8 +1,15 @@
 """Tests for workspace directory management utilities."""
 
 import json
+import os
 
-from pgw.utils.paths import create_workspace, save_metadata, slugify, workspace_paths
+from pgw.utils.paths import (
+    create_workspace,
+    find_video,
+    save_metadata,
+    slugify,
+    workspace_paths,
+)
 
 
 class TestSlugify:
@@ -56,10 +63,40 @@ class TestCreateWorkspace:
         # Both share the "my-video" parent
         assert ws1.parent.name == "my-video"
 
+    def test_same_second_runs_get_distinct_timestamps(self, tmp_path):
+        """Back-to-back runs never share (and overwrite) one workspace."""
+        names = [create_workspace("My Video", base_dir=tmp_path).name for _ in range(4)]
+        assert len(set(names)) == 4
+        assert all(len(name) == 15 for name in names)  # Still YYYYMMDD_HHMMSS
+
+
+class TestFindVideo:
+    def test_finds_video(self, tmp_path):
+        (tmp_path / "video.webm").write_bytes(b"v")
+        assert find_video(tmp_path) == tmp_path / "video.webm"
+
+    def test_prefers_extension_order(self, tmp_path):
+        (tmp_path / "video.mkv").write_bytes(b"v")
+        (tmp_path / "video.mp4").write_bytes(b"v")
+        assert find_video(tmp_path) == tmp_path / "video.mp4"
+
+    def test_skips_broken_symlink(self, tmp_path):
+        os.symlink(tmp_path / "missing.mp4", tmp_path / "video.mp4")
+        (tmp_path / "video.mov").write_bytes(b"v")
+        assert find_video(tmp_path) == tmp_path / "video.mov"
+
+    def test_ignores_other_files(self, tmp_path):
+        (tmp_path / "video.mp4.part").write_bytes(b"v")
+        (tmp_path / "audio.wav").write_bytes(b"a")
+        assert find_video(tmp_path) is None
+
+    def test_missing_workspace(self, tmp_path):
+        assert find_video(tmp_path / "nope") is None
+
 
 class TestWorkspacePaths:
     def test_without_translation(self, tmp_path):
-        paths = workspace_paths(tmp_path, "fr")
+        paths = workspace_paths(tmp_path, "fr").as_dict()
         assert paths["video"] == tmp_path / "video.mp4"
         assert paths["audio"] == tmp_path / "audio.wav"
         assert paths["transcription_vtt"] == tmp_path / "transcription.fr.vtt"
@@ -68,11 +105,16 @@ class TestWorkspacePaths:
         assert "translation_vtt" not in paths
 
     def test_with_translation(self, tmp_path):
-        paths = workspace_paths(tmp_path, "fr", target_lang="en")
+        paths = workspace_paths(tmp_path, "fr", target_lang="en").as_dict()
         assert paths["translation_vtt"] == tmp_path / "translation.en.vtt"
         assert paths["translation_txt"] == tmp_path / "translation.en.txt"
         assert paths["bilingual_vtt"] == tmp_path / "bilingual.fr-en.vtt"
 
+    def test_attribute_access(self, tmp_path):
+        paths = workspace_paths(tmp_path, "fr")
+        assert paths.audio == tmp_path / "audio.wav"
+        assert paths.translation_vtt is None
+
 
 class TestSaveMetadata:
     def test_saves_json(self, tmp_path):
@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from pgw.llm.prompts import (
     UNTRANSLATED_MARKER,
     build_refine_schema,
@@ -14,48 +16,33 @@ from pgw.llm.prompts import (
 )
 
 
-def test_parse_extra_lines_truncated():
-    response = "1. A\n2. B\n3. C\n4. D"
-    result, exact = parse_numbered_response(response, 2)
-    assert result == ["A", "B"]
-    assert exact is False
-
-
-def test_parse_fewer_lines_padded():
-    response = "1. Only one"
-    result, exact = parse_numbered_response(response, 3)
-    assert result == ["Only one", "", ""]
-    assert exact is False
-
-
-def test_parse_exact_match():
-    response = "1. Hello\n2. World"
-    result, exact = parse_numbered_response(response, 2)
-    assert result == ["Hello", "World"]
-    assert exact is True
-
-
-def test_parse_blank_lines_ignored():
-    response = "1. Hello\n\n2. World\n\n"
-    result, exact = parse_numbered_response(response, 2)
-    assert result == ["Hello", "World"]
-    assert exact is True
-
-
-def test_parse_no_numbering_ignored():
-    """Non-numbered lines are ignored to avoid counting context/explanations."""
-    response = "Just plain text\nAnother line"
-    result, exact = parse_numbered_response(response, 2)
-    assert result == ["", ""]
-    assert exact is False
-
-
-def test_parse_mixed_numbered_and_plain():
-    """Only numbered lines are extracted, plain text is ignored."""
-    response = "Here are the translations:\n1. Hello\n2. World\nHope this helps!"
-    result, exact = parse_numbered_response(response, 2)
-    assert result == ["Hello", "World"]
-    assert exact is True
+@pytest.mark.parametrize(
+    "response, count, expected, exact",
+    [
+        ("1. A\n2. B\n3. C\n4. D", 2, ["A", "B"], False),
+        ("1. Only one", 3, ["Only one", "", ""], False),
+        ("1. Hello\n2. World", 2, ["Hello", "World"], True),
+        ("1. Hello\n\n2. World\n\n", 2, ["Hello", "World"], True),
+        # Non-numbered lines are ignored to avoid counting context/explanations
+        ("Just plain text\nAnother line", 2, ["", ""], False),
+        (
+            "Here are the translations:\n1. Hello\n2. World\nHope this helps!",
+            2,
+            ["Hello", "World"],
+            True,
+        ),
+    ],
+    ids=[
+        "extra-lines-truncated",
+        "fewer-lines-padded",
+        "exact-match",
+        "blank-lines-ignored",
+        "no-numbering-ignored",
+        "mixed-numbered-and-plain",
+    ],
+)
+def test_parse_numbered_response(response, count, expected, exact):
+    assert parse_numbered_response(response, count) == (expected, exact)
 
 
 def test_format_history_context_empty():
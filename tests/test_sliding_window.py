@@ -15,7 +15,6 @@ from unittest.mock import patch
 
 import pytest
 
-from pgw.core.config import LLMConfig
 from pgw.core.models import SubtitleSegment
 from pgw.llm import translator
 
@@ -46,11 +45,13 @@ def chunk_tagging_mock():
     return fake_complete, call_count
 
 
-def test_each_segment_translated_exactly_once(chunk_tagging_mock):
+def test_each_segment_translated_exactly_once(chunk_tagging_mock, default_llm_config):
     fake, calls = chunk_tagging_mock
     segments = _make_segments(40)
     with patch("pgw.llm.translator.complete", side_effect=fake):
-        result = translator.translate_subtitles(segments, "fr", "en", LLMConfig(), chunk_size=15)
+        result = translator.translate_subtitles(
+            segments, "fr", "en", default_llm_config, chunk_size=15
+        )
 
     assert len(result.translated) == len(segments)
     for orig, trans in zip(segments, result.translated):
@@ -60,7 +61,7 @@ def test_each_segment_translated_exactly_once(chunk_tagging_mock):
     assert calls["n"] >= 2  # confirms multi-chunk path was exercised
 
 
-def test_boundary_segments_are_overwritten_by_later_chunk(chunk_tagging_mock):
+def test_boundary_segments_are_overwritten_by_later_chunk(chunk_tagging_mock, default_llm_config):
     """Segments in the back-overlap window should carry the LATER chunk's tag.
 
     This pins the design: chunk N+1 re-translates the last back_overlap
@@ -69,7 +70,7 @@ def test_boundary_segments_are_overwritten_by_later_chunk(chunk_tagging_mock):
     """
     fake, _ = chunk_tagging_mock
     segments = _make_segments(40)
-    cfg = LLMConfig()
+    cfg = default_llm_config
     chunk_size, overlap, back_overlap = translator._chunk_params(cfg, 15)
     assert back_overlap >= 1, "test requires non-zero back_overlap"
 
@@ -98,7 +99,7 @@ def test_boundary_segments_are_overwritten_by_later_chunk(chunk_tagging_mock):
             )
 
 
-def test_forward_overlap_lookahead_is_discarded(chunk_tagging_mock):
+def test_forward_overlap_lookahead_is_discarded(chunk_tagging_mock, default_llm_config):
     """The forward-overlap lookahead from chunk N must NOT end up in the output.
 
     Chunk N translates [keep_start_N .. keep_end_N + overlap] but only
@@ -107,7 +108,7 @@ def test_forward_overlap_lookahead_is_discarded(chunk_tagging_mock):
     """
     fake, _ = chunk_tagging_mock
     segments = _make_segments(40)
-    cfg = LLMConfig()
+    cfg = default_llm_config
     chunk_size, overlap, back_overlap = translator._chunk_params(cfg, 15)
 
     with patch("pgw.llm.translator.complete", side_effect=fake):
@@ -132,18 +133,20 @@ def test_forward_overlap_lookahead_is_discarded(chunk_tagging_mock):
         )
 
 
-def test_single_chunk_no_overlap_logic(chunk_tagging_mock):
+def test_single_chunk_no_overlap_logic(chunk_tagging_mock, default_llm_config):
     """When all segments fit in one chunk, no overlap re-translation occurs."""
     fake, calls = chunk_tagging_mock
     segments = _make_segments(8)
     with patch("pgw.llm.translator.complete", side_effect=fake):
-        result = translator.translate_subtitles(segments, "fr", "en", LLMConfig(), chunk_size=15)
+        result = translator.translate_subtitles(
+            segments, "fr", "en", default_llm_config, chunk_size=15
+        )
 
     assert calls["n"] == 1
     assert all(seg.text == "chunk1" for seg in result.translated)
 
 
-def test_refine_honors_explicit_chunk_size(chunk_tagging_mock):
+def test_refine_honors_explicit_chunk_size(chunk_tagging_mock, default_llm_config):
     """``refine_subtitles`` must respect an explicit ``chunk_size`` argument.
 
     Regression: the pipeline used to call ``refine_subtitles`` without
@@ -155,7 +158,7 @@ def test_refine_honors_explicit_chunk_size(chunk_tagging_mock):
     fake, calls = chunk_tagging_mock
     segments = _make_segments(40)
     with patch("pgw.llm.refine.complete", side_effect=fake):
-        result = refine.refine_subtitles(segments, "fr", LLMConfig(), chunk_size=10)
+        result = refine.refine_subtitles(segments, "fr", default_llm_config, chunk_size=10)
 
     assert len(result) == len(segments)
     assert calls["n"] >= 4, f"chunk_size=10 over 40 segments should split, got {calls['n']} calls"
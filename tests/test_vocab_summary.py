@@ -2,28 +2,30 @@
 
 import pytest
 
-from pgw.vocab.summary import zipf_to_difficulty
+from pgw.vocab.summary import zipf_to_difficulty, zipf_to_difficulty_batch
+
+_ZIPF_CASES = [
+    (7.0, "A1"),
+    (5.1, "A1"),
+    (5.0, "A2"),
+    (4.1, "A2"),
+    (4.0, "B1"),
+    (3.5, "B1"),
+    (3.0, "B2"),
+    (2.5, "B2"),
+    (2.0, "C1"),
+    (1.5, "C1"),
+    (1.0, "C2"),
+    (0.5, "C2"),
+    (0.0, "C2"),
+    (-1.0, "C2"),
+    (-100.0, "C2"),
+]
 
 
 @pytest.mark.parametrize(
     "zipf, expected",
-    [
-        (7.0, "A1"),
-        (5.1, "A1"),
-        (5.0, "A2"),
-        (4.1, "A2"),
-        (4.0, "B1"),
-        (3.5, "B1"),
-        (3.0, "B2"),
-        (2.5, "B2"),
-        (2.0, "C1"),
-        (1.5, "C1"),
-        (1.0, "C2"),
-        (0.5, "C2"),
-        (0.0, "C2"),
-        (-1.0, "C2"),
-        (-100.0, "C2"),
-    ],
+    _ZIPF_CASES,
     ids=[
         "very-high→A1",
         "above-5→A1",
@@ -44,3 +46,113 @@ from pgw.vocab.summary import zipf_to_difficulty
 )
 def test_zipf_to_difficulty(zipf, expected):
     assert zipf_to_difficulty(zipf) == expected
+
+
+def test_zipf_to_difficulty_batch():
+    pytest.importorskip("numpy")
+    zipfs = [zipf for zipf, _ in _ZIPF_CASES]
+    assert zipf_to_difficulty_batch(zipfs).tolist() == [e for _, e in _ZIPF_CASES]
+
+
+# Stubbed analysis for generate_vocab_summary: text → (word, pos, lemma) tokens.
+_PARSES = {
+    "Le chat mange.": [
+        ("Le", "DET", "le"),
+        ("chat", "NOUN", "chat"),
+        ("mange", "VERB", "manger"),
+        (".", "PUNCT", "."),
+    ],
+    "Paris  chat 42 xyzzy USA éphémère": [
+        ("Paris", "PROPN", "Paris"),
+        (" ", "SPACE", " "),
+        ("chat", "NOUN", "chat"),
+        ("42", "NUM", "42"),
+        ("xyzzy", "NOUN", "xyzzy"),
+        ("USA", "NOUN", "usa"),
+        ("éphémère", "ADJ", "éphémère"),
+    ],
+}
+_ZIPFS = {"le": 7.0, "chat": 4.5, "manger": 3.5, "mange": 3.0, "éphémère": 1.5}
+
+
+class _StubNlp:
+    """Stands in for a loaded pipeline, yielding pre-tagged Docs."""
+
+    def __init__(self) -> None:
+        from spacy.vocab import Vocab
+
+        self.vocab = Vocab()
+
+    def pipe(self, texts, batch_size=50):
+        from spacy.tokens import Doc
+
+        for text in texts:
+            words, pos, lemmas = zip(*_PARSES[text])
+            yield Doc(self.vocab, words=list(words), pos=list(pos), lemmas=list(lemmas))
+
+
+@pytest.fixture
+def stub_vocab_models(monkeypatch):
+    pytest.importorskip("spacy")
+    wordfreq = pytest.importorskip("wordfreq")
+    import pgw.vocab.summary as summary
+
+    nlp = _StubNlp()
+    monkeypatch.setattr(summary, "load_spacy_model", lambda language, **kwargs: nlp)
+    monkeypatch.setattr(wordfreq, "zipf_frequency", lambda word, lang: _ZIPFS.get(word, 0.0))
+
+
+def test_generate_vocab_summary_statistics(stub_vocab_models):
+    from pgw.core.models import SubtitleSegment
+    from pgw.vocab.summary import generate_vocab_summary
+
+    segments = [SubtitleSegment(text=text, start=0.0, end=1.0) for text in _PARSES]
+    summary = generate_vocab_summary(segments, "fr")
+
+    # PUNCT, SPACE, NUM and PROPN are dropped by POS; "USA" as an abbreviation.
+    assert summary["total_words"] == 6
+    assert summary["unique_lemmas"] == 5
+    # manger is scored by its lemma (3.5 > surface 3.0); xyzzy (zipf 0) is C2.
+    assert summary["difficulty_distribution"] == {
+        "A1": 1,
+        "A2": 1,
+        "B1": 1,
+        "B2": 0,
+        "C1": 1,
+        "C2": 1,
+    }
+    # Tokens count repetitions and leave out xyzzy as an ASR error.
+    assert summary["token_distribution"] == {
+        "A1": 1,
+        "A2": 2,
+        "B1": 1,
+        "B2": 0,
+        "C1": 1,
+        "C2": 0,
+    }
+    assert summary["coverage"] == {
+        "A1": 0.2,
+        "A2": 0.6,
+        "B1": 0.8,
+        "B2": 0.8,
+        "C1": 1.0,
+        "C2": 1.0,
+    }
+    assert summary["estimated_difficulty"] == "C1"
+    rare = [w["lemma"] for w in summary["top_rare_words"]]
+    assert rare == ["éphémère", "manger", "chat", "le"]
+
+
+def test_generate_vocab_summary_empty(stub_vocab_models):
+    from pgw.vocab.summary import generate_vocab_summary
+
+    summary = generate_vocab_summary([], "fr")
+
+    assert summary["total_words"] == 0
+    assert summary["difficulty_distribution"] == dict.fromkeys(
+        ("A1", "A2", "B1", "B2", "C1", "C2"), 0
+    )
+    assert summary["token_distribution"] == {}
+    assert summary["coverage"] == {}
+    assert summary["estimated_difficulty"] == "A1"
+    assert summary["top_rare_words"] == []